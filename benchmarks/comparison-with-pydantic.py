@@ -103,6 +103,17 @@ class GameModel(middle.Model):
     )
 
 
+class CompiledCityModel(CityModel):
+    __model_options__ = {"compiled": True}
+
+
+class CompiledGameModel(GameModel):
+    __model_options__ = {"compiled": True}
+    awesome_city: CompiledCityModel = middle.field(
+        description="One awesome city built"
+    )
+
+
 class GamePydantic(BaseModel):
     name: str = ...
     platform: PlatformEnum = ...
@@ -152,6 +163,14 @@ def test_middle():
     assert isinstance(p, dict)
 
 
+def test_middle_compiled():
+    game = CompiledGameModel(**MODEL_INSTANCE)
+    assert isinstance(game, CompiledGameModel)
+    assert isinstance(game.awesome_city, CompiledCityModel)
+    p = middle.asdict(game)
+    assert isinstance(p, dict)
+
+
 # --------------------------------------------------------------- #
 # Run tests
 # --------------------------------------------------------------- #
@@ -167,11 +186,18 @@ def main():
             "for i in range({}): test_middle()".format(TOTAL_LOOPS),
             sort="tottime",
         )
+        cProfile.run(
+            "for i in range({}): test_middle_compiled()".format(TOTAL_LOOPS),
+            sort="tottime",
+        )
     else:
         timy.timer(ident="pydantic", loops=TOTAL_LOOPS)(
             test_pydantic
         ).__call__()
         timy.timer(ident="middle", loops=TOTAL_LOOPS)(test_middle).__call__()
+        timy.timer(ident="middle (compiled)", loops=TOTAL_LOOPS)(
+            test_middle_compiled
+        ).__call__()
 
 
 if __name__ == "__main__":
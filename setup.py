@@ -59,8 +59,9 @@ setup(
         "customizable",
         "utilities",
     ],
-    install_requires=["attrs>=19.1.0", "python-dateutil>=2.8.0"],
+    install_requires=["attrs>=20.1.0", "python-dateutil>=2.8.0"],
     extras_require={
+        "numpy": ["numpy"],
         # eg:
         #   'rst': ['docutils>=0.11'],
         #   ':python_version=="2.6"': ['argparse'],
@@ -3,32 +3,64 @@ __version__ = "0.2.2"
 
 import logging
 
-from . import converters, exceptions, model, options, validators, values
+from . import (
+    arrays,
+    caches,
+    converters,
+    exceptions,
+    json,
+    model,
+    options,
+    parallel,
+    sequences,
+    stream,
+    validators,
+    values,
+)
+from .arrays import ModelArray
 from .compat import TypeRegistry, get_type
 from .config import config
 from .converters import converter
 from .dispatch import type_dispatch
-from .model import Model, field
-from .validators import validate
-from .values import asdict, value_of
+from .json import dump, dumps, load, loads
+from .model import Model, compile_all, evolve, field
+from .sequences import LazyList
+from .validators import validate, validate_columns
+from .values import asdict, asdict_many, value_of
 
 
 logging.getLogger(__name__).addHandler(logging.NullHandler())
 
 __all__ = (
+    "arrays",
     "asdict",
+    "asdict_many",
+    "caches",
+    "compile_all",
     "config",
     "converter",
     "converters",
+    "dump",
+    "dumps",
+    "evolve",
     "exceptions",
     "field",
     "get_type",
+    "json",
+    "LazyList",
+    "load",
+    "loads",
     "Model",
     "model",
+    "ModelArray",
     "options",
+    "parallel",
+    "sequences",
+    "stream",
     "type_dispatch",
     "TypeRegistry",
     "validate",
+    "validate_columns",
     "validators",
     "value_of",
     "values",
@@ -0,0 +1,200 @@
+import typing as t
+
+from array import array
+from enum import EnumMeta
+
+import attr
+
+from .caches import cached
+from .compat import NoneType, get_type, numpy
+from .model import _from_many
+
+
+# the ``array`` typecodes (also understood by ``numpy``) for each column
+# kind; anything else (strings, nullable fields) is kept as an object column
+_typecodes = {int: "q", float: "d", bool: "b"}
+
+
+def _value_type(f):
+    # the type of the values of a field, with ``Optional`` left out
+    if get_type(f.type) is t.Union:
+        args = [a for a in f.type.__args__ if a is not NoneType]
+        if len(args) == 1:
+            return args[0]
+    return f.type
+
+
+def _column_kind(model, f):
+    type_ = _value_type(f)
+    nullable = f.default is None or type_ is not f.type
+    if isinstance(type_, EnumMeta):
+        kinds = {type(m.value) for m in type_}
+        type_ = kinds.pop() if len(kinds) == 1 else object
+    elif type_ not in (int, float, bool, str):
+        raise TypeError(
+            "the field {}.{} of type {!r} can't be stored as a column".format(
+                model.__name__, f.name, f.type
+            )
+        )
+    if nullable or type_ not in _typecodes:
+        return object
+    return type_
+
+
+def _reader(column, kind, type_):
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        read = column.item  # gives Python scalars instead of numpy ones
+    elif kind is bool:
+        return lambda i: bool(column[i])
+    else:
+        read = column.__getitem__
+    if isinstance(type_, EnumMeta):
+        members = type_._value2member_map_
+        return lambda i: members.get(read(i))
+    return read
+
+
+def _writer(column, type_):
+    write = column.__setitem__
+    if isinstance(type_, EnumMeta):
+        return lambda i, v: write(i, None if v is None else v.value)
+    return write
+
+
+# --------------------------------------------------------------- #
+# Row views
+# --------------------------------------------------------------- #
+
+
+def _field_property(k, f):
+    def getter(self):
+        return self._array._readers[k](self._index)
+
+    def setter(self, value):
+        if f.converter is not None:
+            value = f.converter(value)
+        if f.validator is not None and attr.get_run_validators():
+            f.validator(self, f, value)
+        self._array._writers[k](self._index, value)
+
+    return property(getter, setter)
+
+
+def _view_repr(self):
+    return "{}({})".format(
+        self.__class__.__name__,
+        ", ".join(
+            "{}={!r}".format(f.name, getattr(self, f.name))
+            for f in self.__attrs_attrs__
+            if f.repr
+        ),
+    )
+
+
+@cached("model_array_rows")
+def _row_view_cls(model):
+    # ``__attrs_attrs__`` makes ``attr.fields``, ``middle.asdict`` and
+    # ``Model(view)`` work with the views as if they were model instances
+    fields = attr.fields(model)
+    namespace = {
+        "__slots__": ("_array", "_index"),
+        "__attrs_attrs__": fields,
+        "__repr__": _view_repr,
+    }
+    for k, f in enumerate(fields):
+        namespace[f.name] = _field_property(k, f)
+    return type(model.__name__, (), namespace)
+
+
+# --------------------------------------------------------------- #
+# ModelArray
+# --------------------------------------------------------------- #
+
+
+class ModelArray:
+    __slots__ = ("model", "_columns", "_length", "_readers", "_writers")
+
+    def __init__(self, model, records=(), use_numpy=None):
+        if use_numpy is None:
+            use_numpy = numpy is not None
+        elif use_numpy and numpy is None:
+            raise RuntimeError("numpy is not installed")
+        fields = attr.fields(model)
+        kinds = [_column_kind(model, f) for f in fields]
+        types = [_value_type(f) for f in fields]
+        columns = [
+            array(_typecodes[kind]) if kind in _typecodes else []
+            for kind in kinds
+        ]
+        appends = [c.append for c in columns]
+        names = [f.name for f in fields]
+        # the values of enum members are stored, not the members
+        enums = [isinstance(type_, EnumMeta) for type_ in types]
+        length = 0
+        for inst in _from_many(model, records):
+            for name, append, is_enum in zip(names, appends, enums):
+                value = getattr(inst, name)
+                if is_enum and value is not None:
+                    value = value.value
+                append(value)
+            length += 1
+        if use_numpy:
+            columns = [_to_ndarray(c, kind) for c, kind in zip(columns, kinds)]
+        self.model = model
+        self._columns = columns
+        self._length = length
+        self._readers = [
+            _reader(c, kind, type_)
+            for c, kind, type_ in zip(columns, kinds, types)
+        ]
+        self._writers = [_writer(c, type_) for c, type_ in zip(columns, types)]
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("ModelArray index out of range")
+        view = object.__new__(_row_view_cls(self.model))
+        view._array = self
+        view._index = index
+        return view
+
+    def __iter__(self):
+        cls = _row_view_cls(self.model)
+        for index in range(self._length):
+            view = object.__new__(cls)
+            view._array = self
+            view._index = index
+            yield view
+
+    def __repr__(self):
+        return "ModelArray({}, <{} rows>)".format(
+            self.model.__name__, self._length
+        )
+
+    def to_columns(self):
+        # the columns themselves, not copies: enum fields hold the values
+        # of their members
+        return {
+            f.name: c for f, c in zip(attr.fields(self.model), self._columns)
+        }
+
+
+def _to_ndarray(column, kind):
+    if kind in _typecodes:
+        if not column:
+            return numpy.array([], dtype=numpy.dtype(kind))
+        # shares the memory of the ``array`` instead of copying it
+        return numpy.frombuffer(
+            column,
+            dtype=numpy.bool_ if kind is bool else column.typecode,
+        )
+    ndarray = numpy.empty(len(column), dtype=object)
+    ndarray[:] = column
+    return ndarray
+
+
+__all__ = ("ModelArray",)
@@ -0,0 +1,240 @@
+import sys
+import weakref
+
+from collections import namedtuple
+from functools import update_wrapper
+
+from attr import NOTHING
+
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+_caches = {}
+
+_kept_by_class = object()
+_nothing_kept = {}
+
+
+def _keep(cls, cache, value):
+    # keeps ``value`` in the class, unless it's not a class or it can't have
+    # attributes set (like the builtin ones)
+    if not isinstance(cls, type):
+        return False
+    kept = cls.__dict__.get("__middle_cache__", None)
+    if kept is None:
+        try:
+            type.__setattr__(cls, "__middle_cache__", {None: cls})
+        except TypeError:
+            return False
+        kept = cls.__dict__["__middle_cache__"]
+    kept[cache] = value
+    return True
+
+
+class _Cache(dict):
+    # a cache for functions of one argument that doesn't keep its keys alive,
+    # so classes created on the fly can still be garbage collected: what is
+    # computed for a class is kept by the class itself, in its
+    # ``__middle_cache__`` (it can refer back to the class and still go away
+    # with it), other keys are weakly referenced when possible; when bounded,
+    # the least recently used entries are dropped first
+
+    # the counters are slots, which are faster to update on each hit
+    __slots__ = (
+        "_fn",
+        "_maxsize",
+        "_hits",
+        "_misses",
+        "_evictions",
+        "__dict__",
+    )
+
+    def __init__(self, fn, maxsize=None):
+        update_wrapper(self, fn)
+        self._fn = fn
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __call__(self, key):
+        value = self.get(key, NOTHING)
+        if value is NOTHING:
+            if not isinstance(key, type):
+                return self._weak_lookup(key)
+            # subclasses see what's kept by their bases, but that's not theirs
+            kept = getattr(key, "__middle_cache__", _nothing_kept)
+            if kept.get(None, None) is not key:
+                return self._weak_lookup(key)
+            value = kept.get(self, NOTHING)
+            if value is NOTHING:
+                return self._weak_lookup(key)
+            if self._maxsize is not None:
+                # a new reference, replacing the one equal to it
+                self._move_to_end(weakref.ref(key, self._discard))
+        elif self._maxsize is not None:
+            self._move_to_end(key)
+        self._hits += 1
+        return value
+
+    def _move_to_end(self, key):
+        # dicts keep the order of insertion, so the least recently used
+        # entries are the first ones; an entry taken out by another thread
+        # meanwhile (to be moved or evicted) is left alone
+        value = self.pop(key, NOTHING)
+        if value is not NOTHING:
+            self[key] = value
+
+    def _weak_lookup(self, key):
+        try:
+            ref = weakref.ref(key)
+        except TypeError:
+            return self[key]
+        value = self.get(ref, NOTHING)
+        if value is _kept_by_class:
+            # kept by the class in the meantime, by another thread
+            value = key.__dict__["__middle_cache__"].get(self, NOTHING)
+        if value is not NOTHING:
+            if self._maxsize is not None:
+                self._move_to_end(weakref.ref(key, self._discard))
+            self._hits += 1
+            return value
+        self._misses += 1
+        value = self._fn(key)
+        if _keep(key, self, value):
+            self[weakref.ref(key, self._discard)] = _kept_by_class
+        elif isinstance(key, type):
+            self[key] = value  # builtin types never go away anyway
+        else:
+            self[weakref.ref(key, self._discard)] = value
+        if self._maxsize is not None:
+            self._evict(self._maxsize)
+        return value
+
+    def __missing__(self, key):
+        # keys that can't be weakly referenced, like numbers or strings
+        self._misses += 1
+        value = self[key] = self._fn(key)
+        if self._maxsize is not None:
+            self._evict(self._maxsize)
+        return value
+
+    def _discard(self, ref):
+        # the key is gone (and so is the class, with what it kept)
+        self.pop(ref, None)
+
+    def _drop(self, key):
+        # a class that is gone took what it kept with it
+        if self.pop(key, None) is _kept_by_class:
+            cls = key()
+            if cls is not None:
+                cls.__dict__["__middle_cache__"].pop(self, None)
+
+    def _evict(self, maxsize):
+        while len(self) > maxsize:
+            try:
+                key = next(iter(self))
+            except RuntimeError:
+                continue  # changed by another thread, just look again
+            self._drop(key)
+            self._evictions += 1
+
+    def cache_info(self):
+        return CacheInfo(
+            self._hits, self._misses, self._evictions, self._maxsize, len(self)
+        )
+
+    def cache_clear(self):
+        for key in list(self):
+            self._drop(key)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def cache_resize(self, maxsize):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be None or a non negative number")
+        self._maxsize = maxsize
+        if maxsize is not None:
+            self._evict(maxsize)
+
+    def memory_estimate(self):
+        # the (shallow) size of the cache itself and of what it holds, which
+        # doesn't account for objects also referenced somewhere else
+        size = sys.getsizeof(self)
+        for k, v in list(self.items()):
+            if v is _kept_by_class:
+                cls = k()
+                v = cls.__dict__["__middle_cache__"].get(self) if cls else None
+            size += sys.getsizeof(k) + sys.getsizeof(v)
+        return size
+
+    # instances are compared (and hashed) by identity, not as dicts
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+    __hash__ = object.__hash__
+
+    def __repr__(self):
+        return "<middle cache of {!r}>".format(self._fn)
+
+
+def cached(name, maxsize=None):
+    def inner(fn):
+        cache = _caches[name] = _Cache(fn, maxsize)
+        return cache
+
+    return inner
+
+
+def _get(name):
+    try:
+        return _caches[name]
+    except KeyError:
+        raise KeyError(
+            "unknown cache {!r}, use one of: {}".format(
+                name, ", ".join(sorted(_caches))
+            )
+        ) from None
+
+
+# --------------------------------------------------------------- #
+# API
+# --------------------------------------------------------------- #
+
+
+def names():
+    return sorted(_caches)
+
+
+def info(name=None):
+    if name is not None:
+        return _get(name).cache_info()
+    return {k: c.cache_info() for k, c in sorted(_caches.items())}
+
+
+def clear(*names):
+    for name in names or list(_caches):
+        _get(name).cache_clear()
+
+
+def set_maxsize(name, maxsize):
+    _get(name).cache_resize(maxsize)
+
+
+def memory_estimate(name=None):
+    if name is not None:
+        return _get(name).memory_estimate()
+    return {k: c.memory_estimate() for k, c in sorted(_caches.items())}
+
+
+__all__ = (
+    "CacheInfo",
+    "cached",
+    "clear",
+    "info",
+    "memory_estimate",
+    "names",
+    "set_maxsize",
+)
@@ -1,4 +1,22 @@
 from .types import NoneType, RegexPatternType, TypeRegistry, get_type
 
 
-__all__ = ("get_type", "NoneType", "RegexPatternType", "TypeRegistry")
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+__all__ = (
+    "get_type",
+    "NoneType",
+    "numpy",
+    "orjson",
+    "RegexPatternType",
+    "TypeRegistry",
+)
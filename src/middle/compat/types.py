@@ -1,36 +1,32 @@
 import re
 import sys
+import types
 import typing as t
 
 from datetime import date, datetime
 from decimal import Decimal
 from enum import EnumMeta
-from functools import lru_cache
+
+from ..caches import cached
 
 
-_IS_PY36 = False
 RegexPatternType = None
 if sys.version_info[:2] >= (3, 7):
-    from typing import _GenericAlias as GenericType
-
     RegexPatternType = re.Pattern
 else:
-    from typing import GenericMeta as GenericType
-
     RegexPatternType = re._pattern_type
 
-    _IS_PY36 = True
+# ``int | None`` (python 3.10+), which has no ``__origin__``
+UnionType = getattr(types, "UnionType", None)
 
 
 TypeRegistry = {}
 NoneType = type(None)
 
-
-@lru_cache(maxsize=None)
-def get_type(type_):
-    if type_ is None:
-        return NoneType
-    if type_ in (
+# types resolved as something known beforehand, with no further checks
+_known_types = {
+    type_: type_
+    for type_ in (
         str,
         int,
         float,
@@ -44,24 +40,43 @@ def get_type(type_):
         t.Set,
         t.Tuple,
         t.Union,
-    ):
-        return type_
+    )
+}
+_known_types[None] = NoneType
+
+
+def _typing_origins():
+    # the generics from ``typing`` by their origin, e.g. ``list`` gives
+    # ``typing.List``, that's the origin of ``List[int]`` and ``list[int]``
+    # alike (before python 3.7, the origin is the generic itself)
+    origins = {t.Union: t.Union}
+    for name in t.__all__:
+        generic = getattr(t, name)
+        origin = getattr(generic, "__origin__", None)
+        if origin is not None and getattr(generic, "_name", None) == name:
+            origins.setdefault(origin, generic)
+    return origins
 
+
+_origins = _typing_origins()
+
+
+@cached("get_type")
+def get_type(type_):
+    known = _known_types.get(type_, None)
+    if known is not None:
+        return known
     tt = type(type_)
-    if tt == type:
-        tt = type_
-    if hasattr(type_, "__origin__") or isinstance(tt, GenericType):
-        if _IS_PY36:  # py36
-            return type_.__origin__
-        else:  # py37
-            if hasattr(type_, "_name") and isinstance(type_._name, str):
-                return getattr(t, type_._name)
-            return type_.__origin__
-    elif tt == EnumMeta:
+    if tt is EnumMeta:
         return tt
-    elif tt in TypeRegistry:
-        return TypeRegistry[tt]
-    return type_
+    if tt is UnionType:
+        return t.Union
+    origin = getattr(type_, "__origin__", None)
+    if origin is not None:
+        return _origins.get(origin, origin)
+    if tt is type:
+        tt = type_
+    return TypeRegistry.get(tt, type_)
 
 
 __all__ = ("get_type", "NoneType", "RegexPatternType", "TypeRegistry")
@@ -0,0 +1,436 @@
+import datetime
+import linecache
+
+from enum import EnumMeta
+from functools import partial
+
+import attr
+
+from attr import _config  # NOTE: this is internal to attrs
+from attr._make import NOTHING  # NOTE: this is internal to attrs
+from attr._make import _AndValidator  # NOTE: this is internal to attrs
+from attr._make import _hash_cache_field  # NOTE: this is internal to attrs
+from attr.validators import _InstanceOfValidator  # NOTE: internal to attrs
+
+from .converters import (
+    _bool_converter,
+    _date_converter,
+    _dict_converter,
+    _field_converter,
+    _iterable_converter,
+    _none_or_converter,
+    _number_converter,
+    _str_converter,
+    model_converter,
+)
+
+
+@attr.s(slots=True)
+class _Script:
+    lines = attr.ib(factory=list)
+    globs = attr.ib(factory=dict)
+
+    def bind(self, obj):
+        for k, v in self.globs.items():
+            if v is obj:
+                return k
+        name = "_g{}".format(len(self.globs))
+        self.globs[name] = obj
+        return name
+
+    def emit(self, line, indent=1):
+        self.lines.append("    " * indent + line)
+
+    def build(self, fn_name, args, filename):
+        source = "def {}({}):\n{}\n".format(
+            fn_name, ", ".join(args), "\n".join(self.lines or ["    pass"])
+        )
+        code = compile(source, filename, "exec")
+        exec(code, self.globs)
+        # keep the source around for tracebacks, just like attrs does
+        linecache.cache[filename] = (
+            len(source),
+            None,
+            source.splitlines(True),
+            filename,
+        )
+        return self.globs[fn_name]
+
+
+# --------------------------------------------------------------- #
+# Converters
+# --------------------------------------------------------------- #
+
+
+def _passthrough_class(conv):
+    # the class whose instances are returned untouched by the converter
+    if conv is _str_converter:
+        return str
+    if conv is _bool_converter:
+        return bool
+    if conv is _date_converter:
+        return datetime.date
+    if isinstance(conv, EnumMeta):
+        return conv
+    if isinstance(conv, partial) and conv.func in (
+        _number_converter,
+        model_converter,
+    ):
+        return conv.args[0]
+    return None
+
+
+def _conversion(conv, value, script, depth=0):
+    cls = _passthrough_class(conv)
+    if cls is not None:
+        return "({0} if {0}.__class__ is {1} else {2}({0}))".format(
+            value, script.bind(cls), script.bind(conv)
+        )
+    if isinstance(conv, partial):
+        if conv.func is _none_or_converter:
+            return _conversion(conv.args[0], value, script, depth)
+        if conv.func is _iterable_converter:
+            item_conv, is_set = conv.args
+            item = "_i{}".format(depth)
+            return (
+                "{{{} for {} in {}}}" if is_set else "[{} for {} in {}]"
+            ).format(
+                _conversion(item_conv, item, script, depth + 1), item, value
+            )
+        if conv.func is _dict_converter:
+            key_conv, value_conv = conv.args
+            k, v = "_k{}".format(depth), "_v{}".format(depth)
+            return "{{{}: {} for {}, {} in {}.items()}}".format(
+                _conversion(key_conv, k, script, depth + 1),
+                _conversion(value_conv, v, script, depth + 1),
+                k,
+                v,
+                value,
+            )
+    return "{}({})".format(script.bind(conv), value)
+
+
+def _emit_conversion(attribute, arg, script):
+    conv = _field_converter(attribute.type, attribute.metadata)
+    cls = _passthrough_class(conv)
+    if cls is not None:
+        script.emit(
+            "if {0}.__class__ is not {1} and {0} is not None:".format(
+                arg, script.bind(cls)
+            )
+        )
+        if isinstance(conv, EnumMeta):
+            # a plain lookup on the values map, the same one done by the
+            # enum class itself, skipping the EnumMeta.__call__ machinery
+            script.emit("try:", 2)
+            script.emit(
+                "{0} = {1}[{0}]".format(
+                    arg, script.bind(conv._value2member_map_)
+                ),
+                3,
+            )
+            script.emit("except (KeyError, TypeError):", 2)
+            script.emit("{0} = {1}({0})".format(arg, script.bind(conv)), 3)
+        elif (
+            isinstance(conv, partial)
+            and conv.func is model_converter
+            and attr.has(cls)  # models with the deferred option compiled
+            and cls.__new__ is object.__new__
+        ):
+            # the same as ``model_converter``, without going through the
+            # metaclass ``__call__`` (only keywords would be given anyway)
+            cls_name = script.bind(cls)
+            script.emit("if not isinstance({}, {}):".format(arg, cls_name), 2)
+            script.emit(
+                "_inst = {}({})".format(script.bind(object.__new__), cls_name),
+                3,
+            )
+            script.emit("{}.__init__(_inst, **{})".format(cls_name, arg), 3)
+            script.emit("{} = _inst".format(arg), 3)
+        else:
+            script.emit("{} = {}({})".format(arg, script.bind(conv), arg), 2)
+    else:
+        script.emit("if {} is not None:".format(arg))
+        script.emit("{} = {}".format(arg, _conversion(conv, arg, script)), 2)
+
+
+# --------------------------------------------------------------- #
+# Validators
+# --------------------------------------------------------------- #
+
+
+def _flatten_validators(validator):
+    if validator is None:
+        return []
+    if isinstance(validator, _AndValidator):
+        return list(validator._validators)
+    return [validator]
+
+
+def _conditions(validator, attribute, value, script):
+    if isinstance(validator, _InstanceOfValidator):
+        type_ = script.bind(validator.type)
+        if isinstance(validator.type, tuple):
+            return ["not isinstance({}, {})".format(value, type_)]
+        return [
+            "{0}.__class__ is not {1} and not isinstance({0}, {1})".format(
+                value, type_
+            )
+        ]
+    if hasattr(validator, "_conditions"):  # ``middle`` validators
+        return validator._conditions(
+            attribute.default is None, value, script.bind
+        )
+    return None
+
+
+def _emit_validation(attribute, arg, script, inst="self"):
+    attr_name = script.bind(attribute)
+    for validator in _flatten_validators(attribute.validator):
+        call = "{}({}, {}, {})".format(
+            script.bind(validator), inst, attr_name, arg
+        )
+        conditions = _conditions(validator, attribute, arg, script)
+        if conditions is None:
+            script.emit(call, 2)
+        elif conditions:
+            # the validator itself is only called to raise the proper error
+            script.emit(
+                "if {}:".format(
+                    " or ".join("({})".format(c) for c in conditions)
+                ),
+                2,
+            )
+            script.emit(call, 3)
+
+
+# --------------------------------------------------------------- #
+# __init__
+# --------------------------------------------------------------- #
+
+
+def _caches_hash(cls):
+    # ``attrs`` keeps no flag for it, only the name of the attribute used by
+    # the ``__hash__`` it generates, that must be set to ``None`` on init
+    code = getattr(cls.__hash__, "__code__", None)
+    return code is not None and _hash_cache_field in code.co_names
+
+
+def _needs_attrs_init(attributes):
+    return any(
+        not a.init
+        or (isinstance(a.default, attr.Factory) and a.default.takes_self)
+        for a in attributes
+    )
+
+
+def _emit_arguments(attributes, script):
+    # the arguments of ``__init__``, handling factories for default values
+    args, kw_only_args = ["self"], []
+    for a in attributes:
+        arg = a.name.lstrip("_")
+        if a.default is NOTHING:
+            param = arg
+        elif isinstance(a.default, attr.Factory):
+            param = "{}=NOTHING".format(arg)
+            script.emit("if {} is NOTHING:".format(arg))
+            script.emit(
+                "{} = {}()".format(arg, script.bind(a.default.factory)), 2
+            )
+        else:
+            param = "{}={}".format(arg, script.bind(a.default))
+        (kw_only_args if a.kw_only else args).append(param)
+    if kw_only_args:
+        args.append("*")
+        args.extend(kw_only_args)
+    return args
+
+
+def _build_init(cls, script, args, kind):
+    fn = script.build(
+        "__init__",
+        args,
+        "<middle {} init {}.{}>".format(
+            kind, cls.__module__, cls.__qualname__
+        ),
+    )
+    fn.__qualname__ = "{}.__init__".format(cls.__qualname__)
+    return fn
+
+
+def compile_init(cls):
+    attributes = attr.fields(cls)
+    if _needs_attrs_init(attributes):
+        return None  # let attrs handle it
+
+    script = _Script()
+    script.globs.update({"NOTHING": NOTHING, "_config": _config})
+
+    args = _emit_arguments(attributes, script)
+    for a in attributes:
+        if a.type:
+            _emit_conversion(a, a.name.lstrip("_"), script)
+
+    # frozen models, or models validating assignments, have their own
+    # ``__setattr__`` that must not be used on init
+    direct = cls.__setattr__ is object.__setattr__
+    for a in attributes:
+        if not direct:
+            script.emit(
+                "{}(self, {!r}, {})".format(
+                    script.bind(object.__setattr__), a.name, a.name.lstrip("_")
+                )
+            )
+        else:
+            script.emit("self.{} = {}".format(a.name, a.name.lstrip("_")))
+
+    if any(a.validator is not None for a in attributes):
+        script.emit("if _config._run_validators is True:")
+        for a in attributes:
+            _emit_validation(a, a.name.lstrip("_"), script)
+
+    if hasattr(cls, "__attrs_post_init__"):
+        script.emit("self.__attrs_post_init__()")
+
+    if _caches_hash(cls):
+        script.emit(
+            "{}(self, {!r}, None)".format(
+                script.bind(object.__setattr__), _hash_cache_field
+            )
+        )
+
+    return _build_init(cls, script, args, "compiled")
+
+
+def compile_field(cls, attribute):
+    # a function doing for a single value what ``compile_init`` does for
+    # each field: ``convert(inst, value)`` returns the converted value
+    script = _Script()
+    script.globs.update({"_config": _config})
+    if attribute.type:
+        _emit_conversion(attribute, "value", script)
+    if attribute.validator is not None:
+        script.emit("if _config._run_validators is True:")
+        _emit_validation(attribute, "value", script, "inst")
+    script.emit("return value")
+    fn = script.build(
+        "convert",
+        ["inst", "value"],
+        "<middle compiled field {}.{}.{}>".format(
+            cls.__module__, cls.__qualname__, attribute.name
+        ),
+    )
+    fn.__qualname__ = "convert"
+    return fn
+
+
+def compile_lazy_init(cls, raw_name):
+    # an ``__init__`` that just keeps the values given for each argument in
+    # a ``dict`` (``NOTHING`` for default values), to be converted and
+    # validated only when needed
+    attributes = attr.fields(cls)
+    if any(not a.init for a in attributes):
+        return None
+
+    script = _Script()
+    script.globs.update({"NOTHING": NOTHING})
+
+    args, kw_only_args = ["self"], []
+    for a in attributes:
+        arg = a.name.lstrip("_")
+        param = arg if a.default is NOTHING else "{}=NOTHING".format(arg)
+        (kw_only_args if a.kw_only else args).append(param)
+    if kw_only_args:
+        args.append("*")
+        args.extend(kw_only_args)
+    script.emit(
+        "{}(self, {!r}, {{{}}})".format(
+            script.bind(object.__setattr__),
+            raw_name,
+            ", ".join(
+                "{0!r}: {0}".format(a.name.lstrip("_")) for a in attributes
+            ),
+        )
+    )
+    if hasattr(cls, "__attrs_post_init__"):
+        script.emit("self.__attrs_post_init__()")
+
+    if _caches_hash(cls):
+        script.emit(
+            "{}(self, {!r}, None)".format(
+                script.bind(object.__setattr__), _hash_cache_field
+            )
+        )
+
+    return _build_init(cls, script, args, "lazy")
+
+
+def compile_construct(cls):
+    # creates instances from values that are trusted to be already
+    # converted and valid, without calling ``__init__``
+    attributes = attr.fields(cls)
+    script = _Script()
+    script.globs.update({"NOTHING": NOTHING})
+    setattr_ = script.bind(object.__setattr__)
+
+    args = []
+    for a in attributes:
+        if not a.init:
+            continue
+        arg = a.name.lstrip("_")
+        if a.default is NOTHING:
+            args.append(arg)
+        elif isinstance(a.default, attr.Factory):
+            args.append("{}=NOTHING".format(arg))
+        else:
+            args.append("{}={}".format(arg, script.bind(a.default)))
+
+    script.emit(
+        "self = {}({})".format(script.bind(cls.__new__), script.bind(cls))
+    )
+    direct = cls.__setattr__ is object.__setattr__
+    for a in attributes:
+        arg = a.name.lstrip("_")
+        if not a.init:
+            if a.default is NOTHING:
+                continue
+            if not isinstance(a.default, attr.Factory):
+                script.emit("{} = {}".format(arg, script.bind(a.default)))
+        if isinstance(a.default, attr.Factory):
+            if a.init:
+                script.emit("if {} is NOTHING:".format(arg))
+            script.emit(
+                "{} = {}({})".format(
+                    arg,
+                    script.bind(a.default.factory),
+                    "self" if a.default.takes_self else "",
+                ),
+                2 if a.init else 1,
+            )
+        if direct:
+            script.emit("self.{} = {}".format(a.name, arg))
+        else:
+            script.emit("{}(self, {!r}, {})".format(setattr_, a.name, arg))
+
+    if hasattr(cls, "__attrs_post_init__"):
+        script.emit("self.__attrs_post_init__()")
+
+    if _caches_hash(cls):
+        script.emit("{}(self, {!r}, None)".format(setattr_, _hash_cache_field))
+
+    script.emit("return self")
+    fn = script.build(
+        "construct",
+        ["*"] + args if args else [],
+        "<middle construct {}.{}>".format(cls.__module__, cls.__qualname__),
+    )
+    fn.__qualname__ = "{}.construct".format(cls.__qualname__)
+    return fn
+
+
+__all__ = (
+    "compile_construct",
+    "compile_field",
+    "compile_init",
+    "compile_lazy_init",
+)
@@ -8,11 +8,12 @@ from functools import partial
 
 import attr
 
-from .compat import NoneType
+from .compat import NoneType, get_type
 from .config import config
 from .dispatch import type_dispatch
 from .dtutils import dt_convert_to_utc, dt_from_iso_string, dt_from_timestamp
 from .exceptions import InvalidType
+from .sequences import LazyList
 
 
 _num_re = re.compile(r"^[+-]?([0-9]+([\.][0-9]*)?|[.][0-9]+)$")
@@ -29,6 +30,12 @@ def _iterable_converter(value_converter, is_set, value):
     return res if not is_set else set(res)
 
 
+def _lazy_list_converter(item_converter, value):
+    if isinstance(value, LazyList):
+        return value
+    return LazyList(value, item_converter)
+
+
 def _dict_converter(key_converter, value_converter, value):
     return {key_converter(k): value_converter(v) for k, v in value.items()}
 
@@ -106,6 +113,27 @@ def _bool_converter(value):
     )
 
 
+def _subclass_converter(type_, base_converter, value):
+    # converts the value as its base (supported) type, then makes it an
+    # instance of the subclass
+    if isinstance(value, type_):
+        return value
+    value = base_converter(value)
+    if isinstance(value, type_):
+        return value
+    if isinstance(value, datetime.datetime):
+        return type_.combine(value.date(), value.timetz())
+    if isinstance(value, datetime.date):
+        return type_.fromordinal(value.toordinal())
+    return type_(value)
+
+
+def _for_subclasses(base, base_converter, type_):
+    if type_ is base or not issubclass(type_, base):
+        return base_converter
+    return partial(_subclass_converter, type_, base_converter)
+
+
 def _multiple_types_converter(converters, value):
     raised_exc = []
     converted_values = []
@@ -148,7 +176,7 @@ def _none_or_converter(converter, value):
     return converter(value)
 
 
-@type_dispatch(lru=True)
+@type_dispatch(lru=True, name="converter")
 def converter(type_):
     if attr.has(type_):
         return partial(model_converter, type_)
@@ -164,13 +192,18 @@ def _converter_none(type_):
 @converter.register(str)
 @converter.register(bytes)
 def _converter_str(type_):
-    return _str_converter
+    return _for_subclasses(str, _str_converter, type_)
 
 
 @converter.register(int)
 @converter.register(float)
 @converter.register(Decimal)
 def _converter_number(type_):
+    for base in (int, float, Decimal):
+        if type_ is not base and issubclass(type_, base):
+            return partial(
+                _subclass_converter, type_, partial(_number_converter, base)
+            )
     return partial(_number_converter, type_)
 
 
@@ -181,12 +214,12 @@ def _converter_bool(type_):
 
 @converter.register(datetime.date)
 def _converter_date(type_):
-    return _date_converter
+    return _for_subclasses(datetime.date, _date_converter, type_)
 
 
 @converter.register(datetime.datetime)
 def _converter_datetime(type_):
-    return _datetime_converter
+    return _for_subclasses(datetime.datetime, _datetime_converter, type_)
 
 
 @converter.register(EnumMeta)
@@ -196,7 +229,7 @@ def _converter_enum(type_):
 
 @converter.register(t.List)
 def _converter_iterable_list(type_):
-    if not type_.__args__:
+    if not getattr(type_, "__args__", None):
         raise InvalidType(
             "{0!r} must be set with only one parameter, e.g. {0!r}[float]".format(
                 type_
@@ -205,9 +238,24 @@ def _converter_iterable_list(type_):
     return partial(_iterable_converter, converter(type_.__args__[0]), False)
 
 
+def lazy_list_converter(type_):
+    if get_type(type_) is not t.List or not getattr(type_, "__args__", None):
+        raise InvalidType(
+            "only List fields with an item type can be lazy, e.g. "
+            "List[float], not {!r}".format(type_)
+        )
+    return partial(_lazy_list_converter, converter(type_.__args__[0]))
+
+
+def _field_converter(type_, metadata):
+    if metadata.get("lazy", False):
+        return lazy_list_converter(type_)
+    return converter(type_)
+
+
 @converter.register(t.Set)
 def _converter_iterable_set(type_):
-    if not type_.__args__:
+    if not getattr(type_, "__args__", None):
         raise InvalidType(
             "{0!r} must be set with only one parameter, e.g. {0!r}[float]".format(
                 type_
@@ -218,7 +266,7 @@ def _converter_iterable_set(type_):
 
 @converter.register(t.Dict)
 def _converter_dict(type_):
-    if not type_.__args__:
+    if not getattr(type_, "__args__", None):
         raise InvalidType(
             "{0!r} must be set with parameters, e.g. {0!r}[str, str]".format(
                 type_
@@ -260,7 +308,7 @@ def _converter_union(type_):
 
 @converter.register(t.Tuple)
 def _converter_tuple(type_):
-    if not type_.__args__:
+    if not getattr(type_, "__args__", None):
         raise InvalidType(
             "Tuple must be set with at least one parameter, e.g. Tuple[bool]"
         )
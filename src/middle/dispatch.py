@@ -1,28 +1,47 @@
-from functools import lru_cache
+from abc import ABCMeta
 
 import attr
 
+from .caches import _Cache, cached
 from .compat import get_type
 
 
 @attr.s(cmp=False, slots=True)
 class _TypeDispatch:
     _default_fn = attr.ib()
+    _cache_name = attr.ib(default=None)
     _name = attr.ib(init=False)
     _registry = attr.ib(init=False)
-    _get_fn_cache = attr.ib(init=False)
+    _resolved = attr.ib(init=False)
+    _on_clear = attr.ib(init=False)
 
     def __attrs_post_init__(self):
         self._name = self._default_fn.__name__
         self._registry = {}
-        self._get_fn_cache = lru_cache(maxsize=None)(self._get_fn)
+        if self._cache_name is None:
+            self._resolved = _Cache(self._get_fn)
+        else:
+            self._resolved = cached(self._cache_name)(self._get_fn)
+        self._on_clear = []
 
     def _get_fn(self, type_):
-        return self._registry.get(get_type(type_), self._default_fn)
+        key = get_type(type_)
+        fn = self._registry.get(key, None)
+        if fn is not None or not isinstance(key, type):
+            return fn or self._default_fn
+        # subclasses of registered types, the closest one first
+        for base in key.__mro__[1:]:
+            fn = self._registry.get(base, None)
+            if fn is not None:
+                return fn
+        # virtual subclasses of registered abstract base classes
+        for registered, fn in self._registry.items():
+            if isinstance(registered, ABCMeta) and issubclass(key, registered):
+                return fn
+        return self._default_fn
 
     def __call__(self, *args):
-        fn = self._get_fn_cache(args[0])
-        return fn(*args)
+        return self._resolved(args[0])(*args)
 
     def register(self, type_, fn=None):
         if fn is None:
@@ -34,25 +53,51 @@ class _TypeDispatch:
                 )
             )
         self._registry[type_] = fn
+        self.cache_clear()
         return fn
 
     def unregister(self, type_):
         if type_ in self._registry:
             del self._registry[type_]
-            self._get_fn_cache.cache_clear()
+            self.cache_clear()
 
+    def cache_info(self):
+        return self._resolved.cache_info()
 
-def type_dispatch(lru=False):
+    def cache_clear(self):
+        # types resolved before may resolve to something else now
+        self._resolved.cache_clear()
+        for fn in self._on_clear:
+            fn()
+
+    # the same names used when wrapped by a cache of results
+    dispatch_info = cache_info
+    dispatch_clear = cache_clear
+
+
+def type_dispatch(lru=False, name=None):
+    # with a ``name``, the caches are available in ``middle.caches``: the
+    # types resolved as ``{name}.types`` and the results (if ``lru``) as
+    # ``{name}``
     def inner(fn):
-        td = _TypeDispatch(default_fn=fn)
+        td = _TypeDispatch(
+            default_fn=fn,
+            cache_name=None if name is None else "{}.types".format(name),
+        )
         if lru:
-            lru_td = lru_cache(maxsize=2048)(td)
+            if name is None:
+                lru_td = _Cache(td, maxsize=2048)
+            else:
+                lru_td = cached(name, maxsize=2048)(td)
+            td._on_clear.append(lru_td.cache_clear)
             lru_td.register = td.register
             lru_td.unregister = td.unregister
+            lru_td.dispatch_info = td.cache_info
+            lru_td.dispatch_clear = td.cache_clear
             return lru_td
         return td
 
     return inner
 
 
-__all__ = "type_dispatch"
+__all__ = ("type_dispatch",)
@@ -9,6 +9,10 @@ class ValidationError(MiddleException):
     pass
 
 
+class FieldNotLoaded(MiddleException, AttributeError):
+    pass
+
+
 class InvalidType(MiddleException):
     def __init__(self, message=None, *args, **kwargs):
         if message is None:
@@ -20,4 +24,9 @@ class InvalidType(MiddleException):
         super().__init__(message)
 
 
-__all__ = ("MiddleException", "ValidationError", "InvalidType")
+__all__ = (
+    "FieldNotLoaded",
+    "MiddleException",
+    "ValidationError",
+    "InvalidType",
+)
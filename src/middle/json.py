@@ -0,0 +1,330 @@
+import datetime
+import io
+import json
+import math
+import typing as t
+
+from decimal import Decimal
+from enum import EnumMeta
+from json.encoder import encode_basestring
+
+import attr
+
+from .caches import cached
+from .compat import get_type, orjson
+from .compiler import _Script
+from .converters import converter
+from .dtutils import dt_to_iso_string
+from .values import _raw_primitive, value_of
+
+
+def _json_default(value):
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    fn = value_of(type(value))
+    if fn is not _raw_primitive:
+        return fn(value)
+    raise TypeError(
+        "Object of type {} is not JSON serializable".format(
+            value.__class__.__name__
+        )
+    )
+
+
+# the backend used for everything that is already (or almost) a JSON value,
+# like lists of primitives, dicts, ``None`` or custom serialized values
+if orjson is not None:
+
+    _orjson_options = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    )  # datetimes are converted by ``middle`` itself
+
+    def _dumps_native(value):
+        return orjson.dumps(
+            value, default=_json_default, option=_orjson_options
+        ).decode("utf-8")
+
+    _loads_native = orjson.loads
+
+else:  # pragma: no cover
+    _dumps_native = json.JSONEncoder(
+        ensure_ascii=False, separators=(",", ":"), default=_json_default
+    ).encode
+    _loads_native = json.loads
+
+
+def _json_key(value):
+    # the same done by ``json`` for keys that aren't strings
+    if isinstance(value, str):
+        return value
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return "null"
+    if isinstance(value, float):
+        return float.__repr__(value)
+    if isinstance(value, int):
+        return int.__repr__(value)
+    return str(value)
+
+
+# --------------------------------------------------------------- #
+# Compiled encoders
+# --------------------------------------------------------------- #
+
+_primitives = (str, int, float, bool)
+
+
+def _encoding(type_, value, script, depth=0):
+    # the source of an expression that gives the JSON text of ``value``
+    native = script.bind(_dumps_native)
+    if type_ is str:
+        return "({1}({0}) if {0}.__class__ is str else {2}({0}))".format(
+            value, script.bind(encode_basestring), native
+        )
+    if type_ is int:
+        return "({1}({0}) if {0}.__class__ is int else {2}({0}))".format(
+            value, script.bind(int.__repr__), native
+        )
+    if type_ is float:
+        # ``nan`` and ``inf`` are left for the backend to decide
+        return (
+            "({1}({0}) if {0}.__class__ is float and {2}({0}) "
+            "else {3}({0}))".format(
+                value,
+                script.bind(float.__repr__),
+                script.bind(math.isfinite),
+                native,
+            )
+        )
+    if type_ is bool:
+        return (
+            '("true" if {0} is True else "false" if {0} is False '
+            "else {1}({0}))".format(value, native)
+        )
+    if isinstance(type_, EnumMeta):
+        if all(isinstance(m.value, str) for m in type_):
+            expr = "{}({}._value_)".format(
+                script.bind(encode_basestring), value
+            )
+        else:
+            expr = "{}({}._value_)".format(native, value)
+    elif attr.has(type_):
+        # only instances of subclasses have their function looked up
+        expr = (
+            "({1}({0}) if {0}.__class__ is {2} "
+            "else {3}({0}.__class__)({0}))"
+        )
+        expr = expr.format(
+            value,
+            script.bind(_encoder_fn(type_)),
+            script.bind(type_),
+            script.bind(_encoder_fn),
+        )
+    elif isinstance(type_, type) and issubclass(type_, datetime.datetime):
+        expr = "'\"' + {}({}) + '\"'".format(
+            script.bind(dt_to_iso_string), value
+        )
+    elif isinstance(type_, type) and issubclass(type_, datetime.date):
+        expr = "'\"' + {}.isoformat() + '\"'".format(value)
+    elif type_ is Decimal:
+        expr = "{}(float({}))".format(script.bind(_encode_float), value)
+    else:
+        expr = _container_encoding(type_, value, script, depth)
+        if expr is None:
+            fn = value_of(type_)
+            if fn is _raw_primitive:
+                return "{}({})".format(native, value)
+            return "{}({}({}))".format(native, script.bind(fn), value)
+    return "('null' if {} is None else {})".format(value, expr)
+
+
+def _encode_float(value):
+    if math.isfinite(value):
+        return float.__repr__(value)
+    return _dumps_native(value)
+
+
+def _container_encoding(type_, value, script, depth):
+    args = getattr(type_, "__args__", None)
+    if not args or value_of(type_) is not value_of(get_type(type_)):
+        return None  # untyped or with a custom ``value_of``
+    origin = get_type(type_)
+    native = script.bind(_dumps_native)
+    if origin in (t.List, t.Set) or (
+        origin is t.Tuple and len(args) == 2 and args[1] is Ellipsis
+    ):
+        if args[0] in _primitives:
+            if origin is t.Set:
+                return "{}(list({}))".format(native, value)
+            return "{}({})".format(native, value)
+        item = "_i{}".format(depth)
+        return "'[' + ','.join([{} for {} in {}]) + ']'".format(
+            _encoding(args[0], item, script, depth + 1), item, value
+        )
+    if origin is t.Dict:
+        if args[0] is str and args[1] in _primitives:
+            return "{}({})".format(native, value)
+        k, v = "_k{}".format(depth), "_v{}".format(depth)
+        if args[0] is str:
+            key = "{}({})".format(script.bind(encode_basestring), k)
+        else:
+            key = "{}({}({}({})))".format(
+                script.bind(encode_basestring),
+                script.bind(_json_key),
+                script.bind(value_of(args[0])),
+                k,
+            )
+        return (
+            "'{{' + ','.join([{} + ':' + {} for {}, {} in {}.items()]) "
+            "+ '}}'".format(
+                key, _encoding(args[1], v, script, depth + 1), k, v, value
+            )
+        )
+    return None
+
+
+@cached("dumps")
+def _encoder_fn(cls):
+    script = _Script()
+    parts = []
+    for i, f in enumerate(attr.fields(cls)):
+        value = "_{}".format(i)
+        script.emit("{} = inst.{}".format(value, f.name))
+        parts.append(
+            "{!r} + {}".format(
+                ("," if i else "{")
+                + encode_basestring(f.name.lstrip("_"))
+                + ":",
+                _encoding(f.type, value, script),
+            )
+        )
+    if parts:
+        script.emit("return {} + '}}'".format(" + ".join(parts)))
+    else:
+        script.emit("return '{}'")
+    fn = script.build(
+        "dumps",
+        ["inst"],
+        "<middle compiled dumps {}.{}>".format(
+            cls.__module__, cls.__qualname__
+        ),
+    )
+    fn.__qualname__ = "dumps"
+    return fn
+
+
+# --------------------------------------------------------------- #
+# Compiled loaders
+# --------------------------------------------------------------- #
+
+
+def _nested_loader(type_):
+    # a function giving the value for ``type_`` with all the keys not
+    # declared by models left out, or ``None`` if there are no models
+    if attr.has(type_):
+        loader = _loader_fn(type_)
+        return lambda v: loader(v) if v.__class__ is dict else v
+    args = getattr(type_, "__args__", None)
+    if not args:
+        return None
+    origin = get_type(type_)
+    if origin is t.Union:
+        # ``None`` is left as it is by all the loaders
+        members = [a for a in args if a is not type(None)]
+        if len(members) != 1:
+            return None
+        return _nested_loader(members[0])
+    if origin is t.Dict:
+        value_fn = _nested_loader(args[1])
+        if value_fn is None:
+            return None
+        return lambda v: (
+            {k: value_fn(i) for k, i in v.items()}
+            if v.__class__ is dict
+            else v
+        )
+    if origin in (t.List, t.Set, t.Tuple):
+        item_fns = [_nested_loader(a) for a in args if a is not Ellipsis]
+        if len(set(item_fns)) != 1 or item_fns[0] is None:
+            return None
+        item_fn = item_fns[0]
+        return lambda v: (
+            [item_fn(i) for i in v] if v.__class__ is list else v
+        )
+    return None
+
+
+@cached("loads")
+def _loader_fn(cls):
+    script = _Script()
+    cls_name = script.bind(cls)
+    # anything else is given to the model, that knows how to complain
+    script.emit("if data.__class__ is not dict:")
+    script.emit("return {}(data)".format(cls_name), 2)
+    script.emit("kwargs = {}")
+    for f in attr.fields(cls):
+        if not f.init:
+            continue
+        # keyed by the name of the argument, as given to the model
+        arg = f.name.lstrip("_")
+        fn = _nested_loader(f.type) if f.type else None
+        script.emit("if {!r} in data:".format(arg))
+        value = "data[{!r}]".format(arg)
+        if fn is not None:
+            value = "{}({})".format(script.bind(fn), value)
+        script.emit("kwargs[{!r}] = {}".format(arg, value), 2)
+    new = cls.__dict__.get("__middle_new__", None)
+    if new is not None:
+        script.emit("return {}(kwargs)".format(script.bind(new)))
+    elif cls.__new__ is object.__new__:
+        # the same as ``_factory`` in ``middle.model``
+        script.emit(
+            "inst = {}({})".format(script.bind(object.__new__), cls_name)
+        )
+        script.emit("{}.__init__(inst, **kwargs)".format(cls_name))
+        script.emit("return inst")
+    else:
+        script.emit("return {}(**kwargs)".format(cls_name))
+    fn = script.build(
+        "load",
+        ["data"],
+        "<middle compiled loads {}.{}>".format(
+            cls.__module__, cls.__qualname__
+        ),
+    )
+    fn.__qualname__ = "load"
+    return fn
+
+
+# --------------------------------------------------------------- #
+# API
+# --------------------------------------------------------------- #
+
+
+def dumps(inst):
+    return _encoder_fn(inst.__class__)(inst)
+
+
+def dump(inst, fp):
+    data = _encoder_fn(inst.__class__)(inst)
+    fp.write(data if isinstance(fp, io.TextIOBase) else data.encode("utf-8"))
+
+
+def loads(type_, raw):
+    value = _loads_native(raw)
+    if attr.has(type_):
+        return _loader_fn(type_)(value)
+    fn = _nested_loader(type_)
+    if fn is not None:
+        value = fn(value)
+    return converter(type_)(value)
+
+
+def load(type_, fp):
+    return loads(type_, fp.read())
+
+
+__all__ = ("dump", "dumps", "load", "loads")
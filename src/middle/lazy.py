@@ -0,0 +1,100 @@
+import attr
+
+from attr._make import NOTHING  # NOTE: this is internal to attrs
+from attr._make import _hash_cache_field  # NOTE: this is internal to attrs
+
+from .compiler import _caches_hash, compile_field, compile_lazy_init
+
+
+_raw_name = "__middle_raw__"
+
+
+class _LazyField:
+    # a non data descriptor: once the value is converted, it's kept in the
+    # ``__dict__`` of the instance and the descriptor is not used anymore
+    __slots__ = ("name", "arg", "default", "convert")
+
+    def __init__(self, attribute, convert):
+        self.name = attribute.name
+        self.arg = attribute.name.lstrip("_")
+        self.default = attribute.default
+        self.convert = convert
+
+    def __get__(self, inst, owner):
+        if inst is None:
+            return self
+        raw = inst.__dict__[_raw_name]
+        value = raw.get(self.arg, NOTHING)
+        if value is NOTHING:
+            value = self.default
+            if isinstance(value, attr.Factory):
+                if value.takes_self:
+                    value = value.factory(inst)
+                else:
+                    value = value.factory()
+        value = self.convert(inst, value)
+        inst.__dict__[self.name] = value
+        raw.pop(self.arg, None)
+        return value
+
+
+def _lazy_new(cls):
+    # creates instances straight from a ``dict`` of keyword arguments,
+    # checking them with set operations; matching lots of keyword arguments
+    # to the parameters of a function gets slow with hundreds of fields
+    attributes = attr.fields(cls)
+    args = frozenset(a.name.lstrip("_") for a in attributes)
+    required = frozenset(
+        a.name.lstrip("_") for a in attributes if a.default is NOTHING
+    )
+    post_init = hasattr(cls, "__attrs_post_init__")
+    caches_hash = _caches_hash(cls)
+
+    def new(kwargs):
+        keys = kwargs.keys()
+        if not (keys <= args and keys >= required):
+            return type.__call__(cls, **kwargs)  # raises the proper error
+        inst = object.__new__(cls)
+        inst.__dict__[_raw_name] = dict(kwargs)
+        if post_init:
+            inst.__attrs_post_init__()
+        if caches_hash:
+            inst.__dict__[_hash_cache_field] = None
+        return inst
+
+    return new
+
+
+def evolve_lazy(inst, changes):
+    # the changes are kept as given, along with the values not read yet
+    cls = inst.__class__
+    state = dict(inst.__dict__)
+    raw = dict(state.pop(_raw_name))
+    raw.update(changes)
+    for a in attr.fields(cls):
+        if a.name.lstrip("_") in changes:
+            state.pop(a.name, None)
+    state[_raw_name] = raw
+    state.pop(_hash_cache_field, None)
+    new = object.__new__(cls)
+    new.__dict__.update(state)
+    if hasattr(cls, "__attrs_post_init__"):
+        new.__attrs_post_init__()
+    if _caches_hash(cls):
+        new.__dict__[_hash_cache_field] = None
+    return new
+
+
+def make_lazy(cls):
+    init = compile_lazy_init(cls, _raw_name)
+    if init is None:
+        return cls  # not supported, keep it eager
+    for a in attr.fields(cls):
+        setattr(cls, a.name, _LazyField(a, compile_field(cls, a)))
+    cls.__init__ = init
+    if cls.__new__ is object.__new__:
+        cls.__middle_new__ = _lazy_new(cls)
+    return cls
+
+
+__all__ = ("evolve_lazy", "make_lazy")
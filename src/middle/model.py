@@ -1,5 +1,7 @@
 import inspect
 import re
+import threading
+import weakref
 
 from functools import partial
 
@@ -8,10 +10,16 @@ import attr
 from attr._make import NOTHING  # NOTE: this is internal to attrs
 from attr._make import _CountingAttr  # NOTE: this is internal to attrs
 
+from .caches import cached
 from .compat import TypeRegistry
-from .converters import converter, model_converter
+from .compiler import compile_construct, compile_field, compile_init
+from .converters import _field_converter, converter, model_converter
+from .json import loads
+from .lazy import _raw_name, evolve_lazy, make_lazy
 from .options import metadata_options
+from .projection import project
 from .validators import validate
+from .validators.base_validator import _specialize
 from .values import asdict, value_of
 
 
@@ -32,6 +40,14 @@ _attr_ib_blacklist_kwargs = [
     "validator",
 ]
 _attr_s_kwargs = {"cmp": False}
+_model_options = {
+    "compiled": False,
+    "deferred": False,
+    "frozen": False,
+    "lazy": False,
+    "slots": False,
+    "validate_assignment": False,
+}
 _reserved_keys = re.compile("^__[a-z0-9_]+__$", re.I)
 _sentinel = object()
 
@@ -65,65 +81,141 @@ def field(*args, **kwargs):
     return attr.ib(*args, **kwargs)
 
 
+def _resolve_model_options(name, bases, attrs):
+    options = _model_options.copy()
+    for base in reversed(bases):
+        options.update(getattr(base, "__model_options__", {}))
+    own_options = attrs.get("__model_options__", None)
+    if own_options is not None:
+        for k in own_options:
+            if k not in _model_options:
+                raise TypeError(
+                    "unknown model option '{}' for {}".format(k, name)
+                )
+        if own_options.get("frozen", True) is False and options["frozen"]:
+            raise TypeError(
+                "{} can't stop being frozen, as its bases are".format(name)
+            )
+        options.update(own_options)
+    return options
+
+
+def _prepare_namespace(name, bases, attrs, options):
+    # turns everything declared in the class body into ``attrs`` fields
+    # (with converters and validators), returning the arguments for
+    # ``attr.s``
+    if bases:
+        annotations = attrs.get("__annotations__", {})
+        for k in annotations.keys():
+            if _reserved_keys.match(k):
+                continue
+            if k not in attrs:
+                attrs.update(
+                    {k: _translate_to_attrib(k, None, annotations, name)}
+                )
+        for k, f in attrs.items():
+            if _reserved_keys.match(k):
+                continue
+            if not isinstance(f, _CountingAttr):
+                tests = [
+                    inspect.isfunction(f),
+                    inspect.iscoroutinefunction(f),
+                    inspect.isgeneratorfunction(f),
+                    inspect.ismethod(f),
+                    inspect.isroutine(f),
+                    type(f) == property,
+                ]
+                if any(tests):
+                    continue
+                f, type_ = _translate_to_attrib(k, f, annotations, name)
+                attrs[k] = f
+                annotations.update({k: type_})
+            _implement_converters(f, k, annotations)
+            _implement_validators(f, k, annotations)
+        if "__annotations__" not in attrs:
+            attrs["__annotations__"] = annotations
+        # else:
+        #     for k in annotations:
+        #         if k not in attrs["__annotations__"]:
+        #             # XXX does it get here?
+        #             attrs["__annotations__"].update({k: annotations[k]})
+    # "unscramble" fields with default values to the end of the line
+    _keys = list(attrs.keys())
+    _max_counter = max(
+        [
+            f.counter if isinstance(f, _CountingAttr) else -1
+            for f in attrs.values()
+        ]
+    )
+    for k in _keys:
+        if (
+            isinstance(attrs[k], _CountingAttr)
+            and attrs[k]._default != NOTHING
+        ):
+            # send it to the back of the line
+            _max_counter += 1
+            attrs[k].counter = _max_counter
+    attr_kwargs = _attr_s_kwargs.copy()
+    if attrs.get("__attr_s_kwargs__", None) is not None:
+        attr_kwargs = attrs.get("__attr_s_kwargs__")
+        if "init" in attr_kwargs:
+            attr_kwargs.pop("init")
+    if options["slots"]:
+        attr_kwargs["slots"] = True
+    if options["validate_assignment"]:
+        attr_kwargs["on_setattr"] = _convert_on_setattr
+    if options["frozen"]:
+        # compared (and hashed) by value, with the hash computed once
+        attr_kwargs.pop("cmp", None)
+        attr_kwargs.update(eq=True, order=False, frozen=True, cache_hash=True)
+    return attr_kwargs
+
+
+def _finish(cls, options):
+    if options["lazy"]:
+        cls = make_lazy(cls)
+    elif options["compiled"]:
+        init = compile_init(cls)
+        if init is not None:
+            cls.__init__ = init
+    return cls
+
+
 class ModelMeta(type):
     def __new__(mcls, name, bases, attrs):
-        if bases:
-            annotations = attrs.get("__annotations__", {})
-            for k in annotations.keys():
-                if _reserved_keys.match(k):
-                    continue
-                if k not in attrs:
-                    attrs.update(
-                        {k: _translate_to_attrib(k, None, annotations, name)}
-                    )
-            for k, f in attrs.items():
-                if _reserved_keys.match(k):
-                    continue
-                if not isinstance(f, _CountingAttr):
-                    tests = [
-                        inspect.isfunction(f),
-                        inspect.iscoroutinefunction(f),
-                        inspect.isgeneratorfunction(f),
-                        inspect.ismethod(f),
-                        inspect.isroutine(f),
-                        type(f) == property,
-                    ]
-                    if any(tests):
-                        continue
-                    f, type_ = _translate_to_attrib(k, f, annotations, name)
-                    attrs[k] = f
-                    annotations.update({k: type_})
-                _implement_converters(f, k, annotations)
-                _implement_validators(f, k, annotations)
-            if "__annotations__" not in attrs:
-                attrs["__annotations__"] = annotations
-            # else:
-            #     for k in annotations:
-            #         if k not in attrs["__annotations__"]:
-            #             # XXX does it get here?
-            #             attrs["__annotations__"].update({k: annotations[k]})
-        # "unscramble" fields with default values to the end of the line
-        _keys = list(attrs.keys())
-        _max_counter = max(
-            [
-                f.counter if isinstance(f, _CountingAttr) else -1
-                for f in attrs.values()
-            ]
-        )
-        for k in _keys:
-            if (
-                isinstance(attrs[k], _CountingAttr)
-                and attrs[k]._default != NOTHING
-            ):
-                # send it to the back of the line
-                _max_counter += 1
-                attrs[k].counter = _max_counter
-        attr_kwargs = _attr_s_kwargs.copy()
-        if attrs.get("__attr_s_kwargs__", None) is not None:
-            attr_kwargs = attrs.get("__attr_s_kwargs__")
-            if "init" in attr_kwargs:
-                attr_kwargs.pop("init")
-        return attr.s(**attr_kwargs)(super().__new__(mcls, name, bases, attrs))
+        if "__attrs_attrs__" in attrs:
+            # ``attrs`` creating the slotted version of a class that was
+            # already processed
+            return super().__new__(mcls, name, bases, attrs)
+        options = _resolve_model_options(name, bases, attrs)
+        if options["slots"] and options["lazy"]:
+            raise TypeError(
+                "the lazy option can't be used with slots for {}".format(name)
+            )
+        if options["slots"] and options["deferred"]:
+            raise TypeError(
+                "the deferred option can't be used with slots for {}".format(
+                    name
+                )
+            )
+        if options["frozen"] and options["validate_assignment"]:
+            raise TypeError(
+                "frozen models can't be assigned to, so validate_assignment "
+                "can't be used for {}".format(name)
+            )
+        attrs["__model_options__"] = options
+        if options["deferred"]:
+            # everything else is done when the class is first used
+            cls = super().__new__(_DeferredModelMeta, name, bases, attrs)
+            _deferred.add(cls)
+            return cls
+        for base in bases:
+            _compile_deferred(base)
+        if bases and mcls is _DeferredModelMeta:
+            mcls = ModelMeta  # the deferred bases are compiled by now
+        attr_kwargs = _prepare_namespace(name, bases, attrs, options)
+        cls = attr.s(**attr_kwargs)(super().__new__(mcls, name, bases, attrs))
+        return _finish(cls, options)
 
     def __call__(cls, *args, **kwargs):
         if args:
@@ -141,11 +233,167 @@ class ModelMeta(type):
                             for f in attr.fields(cls)
                         }
                     )
+        new = cls.__dict__.get("__middle_new__", None)
+        if new is not None:
+            return new(kwargs)
         return super().__call__(**kwargs)
 
+    def from_many(cls, records, generator=False):
+        instances = _from_many(cls, records)
+        if generator:
+            return instances
+        return list(instances)
+
+    def loads(cls, raw):
+        return loads(cls, raw)
+
+    def partial(cls, data, fields):
+        return project(cls, data, fields)
+
+    def construct(cls, **values):
+        return _constructor(cls)(**values)
+
 
 class Model(metaclass=ModelMeta):
-    pass
+    __slots__ = ()  # so subclasses with the slots option have no __dict__
+
+
+# --------------------------------------------------------------- #
+# Deferred compilation
+# --------------------------------------------------------------- #
+
+_deferred = weakref.WeakSet()
+_deferred_lock = threading.RLock()
+
+
+class _DeferredModelMeta(ModelMeta):
+    # the metaclass of models with the deferred option until they're first
+    # used (instantiated or looked into by ``attrs``), when they're compiled
+    # and become like any other model
+    def __getattribute__(cls, name):
+        # the ``attrs`` attributes would be the ones of the bases otherwise
+        if name == "__attrs_attrs__":
+            _compile_deferred(cls)
+        return type.__getattribute__(cls, name)
+
+    def __call__(cls, *args, **kwargs):
+        _compile_deferred(cls)
+        return cls(*args, **kwargs)
+
+
+def _compile_deferred(cls):
+    if type(cls) is not _DeferredModelMeta:
+        return
+    with _deferred_lock:
+        if type(cls) is not _DeferredModelMeta:
+            return  # compiled by another thread
+        options = cls.__model_options__
+        namespace = dict(cls.__dict__)
+        attr_kwargs = _prepare_namespace(
+            cls.__name__, cls.__bases__, namespace, options
+        )
+        for k, v in namespace.items():
+            if cls.__dict__.get(k, _sentinel) is not v:
+                type.__setattr__(cls, k, v)
+        cls.__class__ = ModelMeta
+        _finish(attr.s(**attr_kwargs)(cls), options)
+        _deferred.discard(cls)
+
+
+def compile_all():
+    # compiles all the models with the deferred option not used yet
+    for cls in list(_deferred):
+        _compile_deferred(cls)
+
+
+@cached("construct")
+def _constructor(cls):
+    return compile_construct(cls)
+
+
+@cached("field_converters")
+def _field_converters(cls):
+    # ``{argument: (field name, convert)}`` for each field
+    return {
+        a.name.lstrip("_"): (a.name, compile_field(cls, a))
+        for a in attr.fields(cls)
+    }
+
+
+@cached("field_setters")
+def _field_setters(cls):
+    return dict(_field_converters(cls).values())
+
+
+def _convert_on_setattr(inst, attribute, value):
+    # the same conversion and validation done on init, for a single field
+    return _field_setters(inst.__class__)[attribute.name](inst, value)
+
+
+def evolve(inst, **changes):
+    # only the values changed are converted and validated, everything else
+    # (nested models included) is shared with the new instance
+    cls = inst.__class__
+    fields = _field_converters(cls)
+    for arg in changes:
+        if arg not in fields:
+            raise TypeError(
+                "evolve() got an unexpected field {!r} for {}".format(
+                    arg, cls.__name__
+                )
+            )
+    if _raw_name in getattr(inst, "__dict__", ()):
+        return evolve_lazy(inst, changes)
+    values = {}
+    for arg, (name, convert) in fields.items():
+        if arg in changes:
+            values[arg] = convert(inst, changes[arg])
+        else:
+            values[arg] = getattr(inst, name)
+    return _constructor(cls)(**values)
+
+
+def _factory(cls):
+    # a function that does the same as ``cls(record)``, with everything that
+    # can be resolved only once for the class kept out of it
+    _compile_deferred(cls)
+    if cls.__new__ is not object.__new__:
+        return cls
+    new = cls.__dict__.get("__middle_new__", None)
+    if new is not None:
+        return lambda record: (
+            new(record) if type(record) is dict else cls(record)
+        )
+    init = cls.__init__
+
+    def factory(record):
+        if type(record) is dict:
+            inst = object.__new__(cls)
+            init(inst, **record)
+            return inst
+        return cls(record)
+
+    return factory
+
+
+def _from_many(cls, records):
+    # the same as calling ``cls(record)`` for each record, but everything
+    # that can be resolved only once for the class is kept out of the loop
+    _compile_deferred(cls)
+    lazy_new = cls.__dict__.get("__middle_new__", None)
+    if lazy_new is not None:
+        for record in records:
+            yield lazy_new(record) if type(record) is dict else cls(record)
+        return
+    init = cls.__init__
+    new = cls.__new__ if cls.__new__ is object.__new__ else None
+    for record in records:
+        if new is not None and type(record) is dict:
+            inst = new(cls)
+            init(inst, **record)
+            yield inst
+        else:
+            yield cls(record)
 
 
 # --------------------------------------------------------------- #
@@ -153,6 +401,7 @@ class Model(metaclass=ModelMeta):
 # --------------------------------------------------------------- #
 
 TypeRegistry[ModelMeta] = Model
+TypeRegistry[_DeferredModelMeta] = Model
 
 # --------------------------------------------------------------- #
 # Simple member definition to attr.ib
@@ -196,9 +445,9 @@ def _implement_converters(field, key, annotations):
     converter_fn = None
 
     if hasattr(field, "type") and field.type:
-        converter_fn = converter(field.type)
+        converter_fn = _field_converter(field.type, field.metadata)
     elif key in annotations:
-        converter_fn = converter(annotations.get(key))
+        converter_fn = _field_converter(annotations.get(key), field.metadata)
 
     if converter_fn is not None:
         field.converter = attr.converters.optional(converter_fn)
@@ -222,3 +471,6 @@ def _implement_validators(field, key, annotations):
     elif key in annotations:
         for v in validate(annotations.get(key), field):
             field.validator(v)
+    # only the constraints that were set are checked when the model is
+    # instantiated, while the validators are still found on the field
+    field._validator = _specialize(field._validator, field._default is None)
@@ -0,0 +1,74 @@
+import gc
+import importlib
+import os
+import pickle
+
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice, repeat
+
+from .model import _from_many
+
+
+def _warm_up(module_name):
+    # the model class is pickled by reference, so its module is imported
+    # once by each worker, before any chunk arrives
+    importlib.import_module(module_name)
+
+
+def _convert_chunk(model, records):
+    return pickle.dumps(
+        list(_from_many(model, records)), pickle.HIGHEST_PROTOCOL
+    )
+
+
+def _load_chunk(payload):
+    # most of the time spent unpickling lots of instances goes to the garbage
+    # collector, that has nothing to collect from them
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return pickle.loads(payload)
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _chunks(records, chunksize):
+    chunk = list(islice(records, chunksize))
+    while chunk:
+        yield chunk
+        chunk = list(islice(records, chunksize))
+
+
+def map_models(
+    model,
+    records,
+    workers=None,
+    chunksize=None,
+    serial_threshold=10000,
+    executor=None,
+):
+    if workers is None:
+        workers = os.cpu_count() or 1
+    records = iter(records)
+    head = list(islice(records, serial_threshold))
+    if len(head) < serial_threshold or (workers < 2 and executor is None):
+        # not worth the overhead of sending everything to other processes
+        return list(_from_many(model, chain(head, records)))
+    if chunksize is None:
+        chunksize = max(serial_threshold // (workers * 4), 100)
+    chunks = _chunks(chain(head, records), chunksize)
+    if executor is not None:
+        payloads = executor.map(_convert_chunk, repeat(model), chunks)
+        return [inst for p in payloads for inst in _load_chunk(p)]
+    initializer, initargs = None, ()
+    if model.__module__ != "__main__":
+        initializer, initargs = _warm_up, (model.__module__,)
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as pool:
+        payloads = pool.map(_convert_chunk, repeat(model), chunks)
+        return [inst for p in payloads for inst in _load_chunk(p)]
+
+
+__all__ = ("map_models",)
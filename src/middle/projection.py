@@ -0,0 +1,122 @@
+import attr
+
+from attr._make import NOTHING  # NOTE: this is internal to attrs
+from attr._make import _hash_cache_field  # NOTE: this is internal to attrs
+
+from .caches import cached
+from .compiler import _caches_hash, compile_field
+from .exceptions import FieldNotLoaded
+
+
+class _NotLoaded:
+    # a non data descriptor for the fields left out of a projection
+    __slots__ = ("name", "fields")
+
+    def __init__(self, name, fields):
+        self.name = name
+        self.fields = fields
+
+    def __get__(self, inst, owner):
+        if inst is None:
+            return self
+        raise FieldNotLoaded(
+            "'{}' was not loaded, only {} were requested".format(
+                self.name, ", ".join(repr(f) for f in sorted(self.fields))
+            )
+        )
+
+
+def _projected_repr(self):
+    return "{}({})".format(
+        self.__class__.__name__,
+        ", ".join(
+            "{}={!r}".format(a.name, getattr(self, a.name))
+            for a in attr.fields(self.__class__)
+            if a.repr
+            and not isinstance(
+                getattr(self.__class__, a.name, None), _NotLoaded
+            )
+        ),
+    )
+
+
+def _projected_cls(cls, fields):
+    # the same class, with the fields not loaded shadowed by descriptors;
+    # created with ``type.__new__`` so ``attrs`` doesn't process it again
+    namespace = {
+        "__module__": cls.__module__,
+        "__qualname__": cls.__qualname__,
+        "__repr__": _projected_repr,
+        "__slots__": (),
+    }
+    for a in attr.fields(cls):
+        if a.name not in fields:
+            namespace[a.name] = _NotLoaded(a.name, fields)
+    return type.__new__(type(cls), cls.__name__, (cls,), namespace)
+
+
+@cached("partial")
+def _projections(cls):
+    # the functions already created for ``cls``, by the fields loaded; kept
+    # per class, so they go away with it
+    return {}
+
+
+def _projection(cls, fields):
+    attributes = {a.name: a for a in attr.fields(cls)}
+    for name in fields:
+        if name not in attributes:
+            raise TypeError(
+                "{} has no field named {!r}".format(cls.__name__, name)
+            )
+    projected = _projected_cls(cls, fields)
+    steps = [
+        (a.name, a.name.lstrip("_"), a.default, compile_field(cls, a))
+        for a in attributes.values()
+        if a.name in fields
+    ]
+    setattr_ = object.__setattr__
+    caches_hash = _caches_hash(cls)
+
+    def project(data):
+        inst = object.__new__(projected)
+        for name, arg, default, convert in steps:
+            value = data.get(arg, NOTHING)
+            if value is NOTHING:
+                if default is NOTHING:
+                    raise TypeError(
+                        "{}.partial() missing the required field {!r}".format(
+                            cls.__name__, arg
+                        )
+                    )
+                if isinstance(default, attr.Factory):
+                    if default.takes_self:
+                        value = default.factory(inst)
+                    else:
+                        value = default.factory()
+                else:
+                    value = default
+            setattr_(inst, name, convert(inst, value))
+        if caches_hash:
+            setattr_(inst, _hash_cache_field, None)
+        return inst
+
+    return project
+
+
+def project(cls, data, fields):
+    if not isinstance(data, dict):
+        raise TypeError(
+            "{}.partial() requires a dict, not {}".format(
+                cls.__name__, type(data).__name__
+            )
+        )
+    fields = frozenset(fields)
+    projections = _projections(cls)
+    fn = projections.get(fields, None)
+    if fn is None:
+        fn = projections[fields] = _projection(cls, fields)
+    return fn(data)
+
+
+__all__ = ("project",)
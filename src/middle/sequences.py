@@ -0,0 +1,69 @@
+from collections.abc import MutableSequence
+
+from attr._make import NOTHING  # NOTE: this is internal to attrs
+
+
+class LazyList(MutableSequence):
+    # the raw items are converted only when read, one by one
+    __slots__ = ("_raw", "_items", "_convert")
+
+    def __init__(self, raw, convert):
+        self._raw = list(raw)
+        self._items = [NOTHING] * len(self._raw)
+        self._convert = convert
+
+    def __len__(self):
+        return len(self._raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+        item = self._items[index]
+        if item is NOTHING:
+            item = self._items[index] = self._convert(self._raw[index])
+        return item
+
+    def __iter__(self):
+        items, raw, convert = self._items, self._raw, self._convert
+        for i in range(len(raw)):
+            item = items[i]
+            if item is NOTHING:
+                item = items[i] = convert(raw[i])
+            yield item
+
+    # values given are kept as they are, just like with ``list``
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = list(value)
+        self._raw[index] = value
+        self._items[index] = value
+
+    def __delitem__(self, index):
+        del self._raw[index]
+        del self._items[index]
+
+    def insert(self, index, value):
+        self._raw.insert(index, value)
+        self._items.insert(index, value)
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyList)):
+            return len(self) == len(other) and all(
+                a == b for a, b in zip(self, other)
+            )
+        return NotImplemented
+
+    def __repr__(self):
+        return "LazyList({!r})".format(list(self))
+
+    def __reduce__(self):
+        # everything is converted, since converters can't always be pickled
+        return LazyList, (list(self), _identity)
+
+
+def _identity(value):
+    return value
+
+
+__all__ = ("LazyList",)
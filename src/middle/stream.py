@@ -0,0 +1,118 @@
+import gzip
+import io
+import json
+
+from .json import _encoder_fn
+from .model import _factory
+
+
+_gzip_magic = b"\x1f\x8b"
+
+
+class _Prefixed(io.RawIOBase):
+    # gives back the bytes already read from ``fileobj`` before reading more
+    def __init__(self, head, fileobj):
+        self._head = head
+        self._fileobj = fileobj
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        if self._head:
+            n = min(len(b), len(self._head))
+            b[:n] = self._head[:n]
+            self._head = self._head[n:]
+            return n
+        data = self._fileobj.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+
+def _lines(fileobj):
+    if isinstance(fileobj.read(0), str):
+        return fileobj  # text can't be compressed
+    if hasattr(fileobj, "peek"):
+        head = fileobj.peek(2)[:2]
+    else:
+        head = fileobj.read(2)
+        fileobj = io.BufferedReader(_Prefixed(head, fileobj))
+    if head == _gzip_magic:
+        return gzip.GzipFile(fileobj=fileobj, mode="rb")
+    return fileobj
+
+
+# --------------------------------------------------------------- #
+# Reading
+# --------------------------------------------------------------- #
+
+
+def read_ndjson(model, fileobj, yield_errors=False):
+    factory = _factory(model)
+    for line_no, line in enumerate(_lines(fileobj), 1):
+        if line.isspace():
+            continue
+        try:
+            inst = factory(json.loads(line))
+        except Exception as e:
+            # anything can come from a bad line (like a list given for a
+            # ``dict`` field), and it's always about that line alone
+            if not yield_errors:
+                raise
+            yield line_no, e
+        else:
+            yield inst
+
+
+# --------------------------------------------------------------- #
+# Writing
+# --------------------------------------------------------------- #
+
+
+def _write_chunks(fileobj, parts, chunksize):
+    # joins ``chunksize`` parts at a time, so there's one ``write`` call per
+    # chunk and never more than a chunk in memory
+    text = isinstance(fileobj, io.TextIOBase)
+    chunk = []
+    for part in parts:
+        chunk.append(part)
+        if len(chunk) >= chunksize:
+            data = "".join(chunk)
+            fileobj.write(data if text else data.encode("utf-8"))
+            chunk.clear()
+    if chunk:
+        data = "".join(chunk)
+        fileobj.write(data if text else data.encode("utf-8"))
+
+
+def _encoded(insts):
+    cls = fn = None
+    for inst in insts:
+        if inst.__class__ is not cls:
+            cls = inst.__class__
+            fn = _encoder_fn(cls)
+        yield fn(inst)
+
+
+def _ndjson_parts(insts):
+    for data in _encoded(insts):
+        yield data + "\n"
+
+
+def _json_array_parts(insts):
+    separator = "["
+    for data in _encoded(insts):
+        yield separator + data
+        separator = ","
+    yield "[]" if separator == "[" else "]"
+
+
+def write_ndjson(fileobj, insts, chunksize=1000):
+    _write_chunks(fileobj, _ndjson_parts(insts), chunksize)
+
+
+def write_json_array(fileobj, insts, chunksize=1000):
+    _write_chunks(fileobj, _json_array_parts(insts), chunksize)
+
+
+__all__ = ("read_ndjson", "write_json_array", "write_ndjson")
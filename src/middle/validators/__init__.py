@@ -1,5 +1,6 @@
 from .base_validator import BaseValidator
+from .columns import validate_columns
 from .rules import validate
 
 
-__all__ = ("BaseValidator", "validate")
+__all__ = ("BaseValidator", "validate", "validate_columns")
@@ -1,11 +1,60 @@
 import attr
 
+from attr._make import _AndValidator  # NOTE: this is internal to attrs
+
+from ..compiler import _Script
+
 
 @attr.s(slots=True, hash=True)
 class BaseValidator:
     def __call__(self, inst, attr, value):  # noqa
         raise Exception("this method needs to be implemented in a subclass")
 
+    def _conditions(self, nullable, value, bind):  # noqa
+        # the source of every expression that evaluates to ``True`` when
+        # ``__call__`` would raise for ``value``, considering only the
+        # constraints that were actually set; ``None`` means the validator
+        # can't be inlined and needs to be called
+        return None
+
+    def _column_errors(self, values):  # noqa
+        # a ``numpy`` boolean array, ``True`` for every item of ``values``
+        # (never ``None``) that would make ``__call__`` raise; ``None``
+        # means the validator needs to be called for each value
+        return None
+
+    @staticmethod
+    def _or_none(nullable, value, conditions):
+        if conditions and nullable:
+            return [
+                "{} is not None and ({})".format(
+                    value, " or ".join(conditions)
+                )
+            ]
+        return conditions
+
+    def specialize(self, nullable=False):
+        # a validator function that only checks the constraints that were
+        # actually set, calling the validator itself just to raise
+        script = _Script()
+        conditions = self._conditions(nullable, "value", script.bind)
+        if conditions is None:
+            return self
+        if conditions:
+            script.emit(
+                "if {}:".format(
+                    " or ".join("({})".format(c) for c in conditions)
+                )
+            )
+            script.emit("{}(inst, attr, value)".format(script.bind(self)), 2)
+        fn = script.build(
+            "validate",
+            ["inst", "attr", "value"],
+            "<middle specialized {!r}>".format(self),
+        )
+        fn.__wrapped__ = self
+        return fn
+
     @property
     def descriptor(self):
         return {
@@ -20,3 +69,28 @@ class BaseValidator:
     @classmethod
     def validator_keys(cls):
         return [f.name for f in attr.fields(cls) if not f.name.startswith("_")]
+
+
+@attr.s(slots=True, hash=True)
+class _SpecializedAndValidator(_AndValidator):
+    # the validators are kept as they were given, for introspection, while
+    # the functions specialized from them are the ones called
+    _fns = attr.ib(eq=False, repr=False)
+
+    def __call__(self, inst, attr, value):  # noqa
+        for fn in self._fns:
+            fn(inst, attr, value)
+
+
+def _specialize(validator, nullable):
+    if not isinstance(validator, _AndValidator) or not any(
+        isinstance(v, BaseValidator) for v in validator._validators
+    ):
+        return validator
+    return _SpecializedAndValidator(
+        validator._validators,
+        tuple(
+            v.specialize(nullable) if isinstance(v, BaseValidator) else v
+            for v in validator._validators
+        ),
+    )
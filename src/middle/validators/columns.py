@@ -0,0 +1,97 @@
+import attr
+
+from attr.validators import _InstanceOfValidator  # NOTE: internal to attrs
+from attr.validators import _OptionalValidator  # NOTE: internal to attrs
+
+from ..compat import numpy
+from ..compiler import _flatten_validators
+from ..exceptions import ValidationError
+
+
+def _fails(validator, field, value):
+    try:
+        validator(None, field, value)
+    except ValidationError:
+        return True
+    return False
+
+
+def _as_column(values):
+    if isinstance(values, numpy.ndarray) and values.ndim == 1:
+        return values
+    try:
+        column = numpy.asarray(values)
+    except ValueError:  # items with different shapes
+        column = None
+    if column is None or column.ndim != 1:
+        # items that are sequences themselves are kept as they are
+        column = numpy.empty(len(values), dtype=object)
+        for i, value in enumerate(values):
+            column[i] = value
+    return column
+
+
+def _accepts_none(field):
+    # as given by the type of the field (``typing.Optional`` or a ``None``
+    # default), or an ``optional`` validator
+    for validator in _flatten_validators(field.validator):
+        if isinstance(validator, _OptionalValidator):
+            return True
+        if isinstance(validator, _InstanceOfValidator):
+            return isinstance(None, validator.type)
+    return field.default is None
+
+
+def _field_errors(field, column):
+    errors = numpy.zeros(len(column), dtype=bool)
+    present = None
+    if column.dtype == object:
+        present = numpy.not_equal(column, None)
+        if not _accepts_none(field):
+            errors |= ~present
+        if present.all():
+            present = None
+        else:
+            column = column[present]
+    for validator in _flatten_validators(field.validator):
+        # types are not checked, only constraints
+        if isinstance(validator, _InstanceOfValidator):
+            continue
+        column_errors = getattr(validator, "_column_errors", None)
+        result = None if column_errors is None else column_errors(column)
+        if result is None:
+            result = numpy.fromiter(
+                (_fails(validator, field, value) for value in column),
+                dtype=bool,
+                count=len(column),
+            )
+        if present is None:
+            errors |= result
+        else:
+            errors[present] |= result
+    return errors
+
+
+def validate_columns(model, columns):
+    if numpy is None:
+        raise RuntimeError("numpy is required to validate columns")
+    fields = {f.name: f for f in attr.fields(model)}
+    errors = None
+    for name, column in columns.items():
+        field = fields.get(name, None)
+        if field is None:
+            raise TypeError(
+                "'{}' is not a field of {}".format(name, model.__name__)
+            )
+        column = _as_column(column)
+        if errors is None:
+            errors = numpy.zeros(len(column), dtype=bool)
+        elif len(column) != len(errors):
+            raise ValueError("all columns must have the same length")
+        errors |= _field_errors(field, column)
+    if errors is None:
+        return numpy.zeros(0, dtype=bool)
+    return errors
+
+
+__all__ = ("validate_columns",)
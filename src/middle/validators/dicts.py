@@ -9,6 +9,25 @@ class DictValidator(BaseValidator):
     min_properties = attr.ib(type=int, default=None)
     max_properties = attr.ib(type=int, default=None)
 
+    def _conditions(self, nullable, value, bind):
+        conditions = []
+        if self.min_properties is not None:
+            conditions.append(
+                "len({}) < {!r}".format(value, self.min_properties)
+            )
+        if self.max_properties is not None:
+            conditions.append(
+                "len({}) > {!r}".format(value, self.max_properties)
+            )
+        if conditions:
+            # ``None`` is never checked against the number of properties
+            return [
+                "{} is not None and ({})".format(
+                    value, " or ".join(conditions)
+                )
+            ]
+        return conditions
+
     def __call__(self, inst, attr, value):
         if attr.default is None and value is None:
             return
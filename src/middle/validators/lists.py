@@ -11,6 +11,19 @@ class ListValidator(BaseValidator):
     unique_items = attr.ib(type=bool, default=False)
     # one_of = attr.ib()  # TODO
 
+    def _conditions(self, nullable, value, bind):
+        conditions = []
+        if self.min_items is not None:
+            conditions.append("len({}) < {!r}".format(value, self.min_items))
+        if self.max_items is not None:
+            conditions.append("len({}) > {!r}".format(value, self.max_items))
+        if self.unique_items:
+            conditions.append(
+                "isinstance({0}, list) and "
+                "any({0}.count(_u) > 1 for _u in {0})".format(value)
+            )
+        return self._or_none(nullable, value, conditions)
+
     def __call__(self, inst, attr, value):
         if attr.default is None and value is None:
             return
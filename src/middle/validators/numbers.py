@@ -4,6 +4,7 @@ from decimal import Decimal
 
 import attr
 
+from ..compat import numpy
 from ..exceptions import ValidationError
 from .base_validator import BaseValidator
 
@@ -16,6 +17,56 @@ class NumberValidator(BaseValidator):
     exclusive_maximum = attr.ib(type=bool, default=False)
     multiple_of = attr.ib(type=t.Union[int, float], default=None)
 
+    def _conditions(self, nullable, value, bind):
+        conditions = []
+        if self.minimum is not None:
+            conditions.append(
+                "{} {} {!r}".format(
+                    value,
+                    "<=" if self.exclusive_minimum else "<",
+                    self.minimum,
+                )
+            )
+        if self.maximum is not None:
+            conditions.append(
+                "{} {} {!r}".format(
+                    value,
+                    ">=" if self.exclusive_maximum else ">",
+                    self.maximum,
+                )
+            )
+        if isinstance(self.multiple_of, float):
+            conditions.append(
+                "float({0}(str({1})) % {0}({2!r})) != 0.0".format(
+                    bind(Decimal), value, str(self.multiple_of)
+                )
+            )
+        elif isinstance(self.multiple_of, int):
+            conditions.append("{} % {!r} != 0".format(value, self.multiple_of))
+        return self._or_none(nullable, value, conditions)
+
+    def _column_errors(self, values):
+        errors = numpy.zeros(len(values), dtype=bool)
+        if self.minimum is not None:
+            if self.exclusive_minimum:
+                errors |= values <= self.minimum
+            else:
+                errors |= values < self.minimum
+        if self.maximum is not None:
+            if self.exclusive_maximum:
+                errors |= values >= self.maximum
+            else:
+                errors |= values > self.maximum
+        if isinstance(self.multiple_of, float):
+            # the same as the ``Decimal`` remainder, up to float precision
+            quotients = values.astype(float) / self.multiple_of
+            errors |= ~numpy.isclose(
+                quotients, numpy.round(quotients), rtol=1e-12, atol=0
+            )
+        elif isinstance(self.multiple_of, int):
+            errors |= values % self.multiple_of != 0
+        return errors
+
     def __call__(self, inst, attr, value):
         if attr.default is None and value is None:
             return
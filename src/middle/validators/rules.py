@@ -9,6 +9,7 @@ import attr
 
 from ..compat import NoneType
 from ..dispatch import type_dispatch
+from ..sequences import LazyList
 from .dicts import DictValidator
 from .lists import ListValidator
 from .numbers import NumberValidator
@@ -34,6 +35,7 @@ _generic_fn = partial(_complex_validator, None)
 _str_fn = partial(_complex_validator, StringValidator)
 _num_fn = partial(_complex_validator, NumberValidator)
 _list_fn = partial(_complex_validator, ListValidator, list)
+_lazy_list_fn = partial(_complex_validator, ListValidator, LazyList)
 _set_fn = partial(_complex_validator, ListValidator, set)
 _dict_fn = partial(_complex_validator, DictValidator, dict)
 
@@ -44,7 +46,7 @@ def _get_instances_of(type_, field):
     return type_
 
 
-@type_dispatch()
+@type_dispatch(name="validate")
 def validate(type_, field):
     return []
 
@@ -71,6 +73,11 @@ def _apply_bool_dt_dttime_enum(type_, field):
 
 @validate.register(t.List)
 def _validate_list(type_, field):
+    if field.metadata.get("lazy", False):
+        if field.metadata.get("unique_items", False):
+            # would need to convert all the items up front
+            raise TypeError("lazy lists can't have unique_items")
+        return _lazy_list_fn(type_, field)
     return _list_fn(type_, field)
 
 
@@ -102,7 +109,10 @@ def _validate_union(type_, field):
                 dict,
             ):
                 validator_types.append(arg)
-            elif attr.has(arg):
+            elif getattr(arg, "__origin__", None) in (list, dict):
+                # like ``typing.List[int]`` or ``list[int]``
+                validator_types.append(arg.__origin__)
+            elif attr.has(arg) or isinstance(arg, EnumMeta):
                 validator_types.append(arg)
 
     return [attr.validators.instance_of(tuple(validator_types))]
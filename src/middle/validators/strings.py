@@ -3,7 +3,7 @@ import typing as t
 
 import attr
 
-from ..compat import RegexPatternType
+from ..compat import RegexPatternType, numpy
 from ..exceptions import ValidationError
 from .base_validator import BaseValidator
 
@@ -25,6 +25,40 @@ class StringValidator(BaseValidator):
             elif isinstance(self.pattern, str):
                 self._re_instance = re.compile(self.pattern)
 
+    def _conditions(self, nullable, value, bind):
+        conditions = []
+        if self.min_length is not None:
+            conditions.append("len({}) < {!r}".format(value, self.min_length))
+        if self.max_length is not None:
+            conditions.append("len({}) > {!r}".format(value, self.max_length))
+        if self._re_instance is not None:
+            conditions.append(
+                "{}({}) is None".format(bind(self._re_instance.match), value)
+            )
+        return self._or_none(nullable, value, conditions)
+
+    def _column_errors(self, values):
+        errors = numpy.zeros(len(values), dtype=bool)
+        if self.min_length is not None or self.max_length is not None:
+            if values.dtype.kind == "U":
+                lengths = numpy.char.str_len(values)
+            else:
+                lengths = numpy.fromiter(
+                    map(len, values), dtype=numpy.intp, count=len(values)
+                )
+            if self.min_length is not None:
+                errors |= lengths < self.min_length
+            if self.max_length is not None:
+                errors |= lengths > self.max_length
+        if self._re_instance is not None:
+            match = self._re_instance.match
+            errors |= numpy.fromiter(
+                (match(v) is None for v in values),
+                dtype=bool,
+                count=len(values),
+            )
+        return errors
+
     def __call__(self, inst, attr, value):
         if attr.default is None and value is None:
             return
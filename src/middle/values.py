@@ -6,16 +6,31 @@ from enum import EnumMeta
 
 import attr
 
+from .caches import cached
 from .compat import get_type
+from .compiler import _Script
 from .dispatch import type_dispatch
 from .dtutils import dt_to_iso_string
 
 
 def asdict(inst):
-    return {
-        f.name: value_of(f.type)(getattr(inst, f.name))
-        for f in attr.fields(inst.__class__)
-    }
+    return _asdict_fn(inst.__class__)(inst)
+
+
+def asdict_many(insts, generator=False):
+    values = _asdict_many(insts)
+    if generator:
+        return values
+    return list(values)
+
+
+def _asdict_many(insts):
+    cls = fn = None
+    for inst in insts:
+        if inst.__class__ is not cls:
+            cls = inst.__class__
+            fn = _asdict_fn(cls)
+        yield fn(inst)
 
 
 def _raw_primitive(value):
@@ -38,26 +53,166 @@ def _raw_enum(value):
     return value.value
 
 
+# the raw functions for containers are only used when there are no type
+# arguments declared (otherwise, see ``_container_fn`` below) and rely on
+# the type of each value
+
+
 def _raw_list(value):
-    return [value_of(get_type(v))(v) for v in value]
+    return [value_of(type(v))(v) for v in value]
 
 
 def _raw_set(value):
-    return {value_of(get_type(v))(v) for v in value}
+    return {value_of(type(v))(v) for v in value}
 
 
 def _raw_tuple(value):
-    return tuple(value_of(get_type(v))(v) for v in value)
+    return tuple(value_of(type(v))(v) for v in value)
 
 
 def _raw_dict(value):
     return {
-        value_of(get_type(k))(k): value_of(type(v))(v)
-        for k, v in value.items()
+        value_of(type(k))(k): value_of(type(v))(v) for k, v in value.items()
     }
 
 
-@type_dispatch(lru=True)
+# --------------------------------------------------------------- #
+# Compiled serializers
+# --------------------------------------------------------------- #
+
+
+def _serialization(type_, value, script):
+    # the source of an expression that gives the same result as
+    # ``value_of(type_)(value)``, or ``None`` if ``value`` can be used as it
+    # is; the values from ``middle`` are kept as ``None`` instead of failing
+    fn = value_of(type_)
+    if fn is _raw_primitive:
+        return None
+    if fn is _raw_enum:
+        expr = "{}.value".format(value)
+    elif fn is _raw_decimal:
+        expr = "float({})".format(value)
+    elif fn is _raw_date:
+        expr = "{}.isoformat()".format(value)
+    elif fn is asdict:
+        # only instances of subclasses have their function looked up
+        expr = (
+            "({1}({0}) if {0}.__class__ is {2} "
+            "else {3}({0}.__class__)({0}))"
+        )
+        expr = expr.format(
+            value,
+            script.bind(_asdict_fn(type_)),
+            script.bind(type_),
+            script.bind(_asdict_fn),
+        )
+    elif fn is _raw_datetime:
+        expr = "{}({})".format(script.bind(dt_to_iso_string), value)
+    else:  # nothing is assumed about custom functions
+        return "{}({})".format(script.bind(fn), value)
+    return "(None if {} is None else {})".format(value, expr)
+
+
+def _item_serialization(type_, value, script):
+    # the same as ``_serialization`` for the items of containers, that have
+    # their own type looked up when the declared one can't tell the function
+    # to use (like unions or ``typing.Any``)
+    if get_type(type_) is t.Union:
+        args = [a for a in type_.__args__ if a is not type(None)]
+        if len(args) == 1:  # ``None`` is kept as it is anyway
+            return _item_serialization(args[0], value, script)
+    elif isinstance(type_, type) or getattr(type_, "__args__", None):
+        return _serialization(type_, value, script)
+    return "{0}({1}.__class__)({1})".format(script.bind(value_of), value)
+
+
+def _container_fn(type_, generic_fn):
+    args = getattr(type_, "__args__", None)
+    if not args:
+        return generic_fn
+    origin = get_type(type_)
+    script = _Script()
+    unpack = None
+    if origin is t.Dict:
+        key = _item_serialization(args[0], "_k", script)
+        value = _item_serialization(args[1], "_v", script)
+        if key is None and value is None:
+            expr = "dict(value)"  # a shallow copy is all that is needed
+        else:
+            expr = "{{{}: {} for _k, _v in value.items()}}".format(
+                key or "_k", value or "_v"
+            )
+    elif origin is t.Tuple and not (len(args) == 2 and args[1] is Ellipsis):
+        items = [
+            _item_serialization(arg, "_{}".format(i), script)
+            for i, arg in enumerate(args)
+        ]
+        if all(item is None for item in items):
+            expr = "tuple(value)"
+        else:
+            unpack = "{}, = value".format(
+                ", ".join("_{}".format(i) for i in range(len(args)))
+            )
+            expr = "({},)".format(
+                ", ".join(
+                    item or "_{}".format(i) for i, item in enumerate(items)
+                )
+            )
+    else:
+        copy_fn = {t.List: "list", t.Set: "set", t.Tuple: "tuple"}[origin]
+        item = _item_serialization(args[0], "_i", script)
+        if item is None:
+            expr = "{}(value)".format(copy_fn)
+        elif origin is t.List:
+            expr = "[{} for _i in value]".format(item)
+        elif origin is t.Set:
+            expr = "{{{} for _i in value}}".format(item)
+        else:
+            expr = "tuple([{} for _i in value])".format(item)
+    if unpack is not None:
+        script.emit("if value is None:")
+        script.emit("return None", 2)
+        script.emit(unpack)
+        script.emit("return {}".format(expr))
+    else:
+        script.emit("return None if value is None else {}".format(expr))
+    return script.build(
+        "value_of",
+        ["value"],
+        "<middle compiled value_of {!r}>".format(type_),
+    )
+
+
+@cached("asdict")
+def _asdict_fn(cls):
+    script = _Script()
+    items = []
+    for i, f in enumerate(attr.fields(cls)):
+        value = "_{}".format(i)
+        expr = _serialization(f.type, value, script)
+        if expr is None:
+            items.append("{!r}: inst.{}".format(f.name, f.name))
+        else:
+            script.emit("{} = inst.{}".format(value, f.name))
+            items.append("{!r}: {}".format(f.name, expr))
+    script.emit("return {{{}}}".format(", ".join(items)))
+    fn = script.build(
+        "asdict",
+        ["inst"],
+        "<middle compiled asdict {}.{}>".format(
+            cls.__module__, cls.__qualname__
+        ),
+    )
+    fn.__qualname__ = "asdict"
+    return fn
+
+
+# --------------------------------------------------------------- #
+# value_of
+# --------------------------------------------------------------- #
+
+
+@type_dispatch(lru=True, name="value_of")
 def value_of(type_):
     if attr.has(type_):
         return asdict
@@ -86,19 +241,19 @@ def _value_of_enum(type_):
 
 @value_of.register(t.List)
 def _value_of_list(type_):
-    return _raw_list
+    return _container_fn(type_, _raw_list)
 
 
 @value_of.register(t.Set)
 def _value_of_set(type_):
-    return _raw_set
+    return _container_fn(type_, _raw_set)
 
 
 @value_of.register(t.Dict)
 def _value_of_dict(type_):
-    return _raw_dict
+    return _container_fn(type_, _raw_dict)
 
 
 @value_of.register(t.Tuple)
 def _value_of_tuple(type_):
-    return _raw_tuple
+    return _container_fn(type_, _raw_tuple)
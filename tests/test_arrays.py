@@ -0,0 +1,171 @@
+import typing as t
+
+from array import array
+from enum import Enum, IntEnum, unique
+
+import pytest
+
+import middle
+
+from middle.exceptions import ValidationError
+
+
+@unique
+class RegionEnum(str, Enum):
+    TROPICAL = "TROPICAL"
+    TEMPERATE = "TEMPERATE"
+
+
+@unique
+class SizeEnum(IntEnum):
+    SMALL = 1
+    BIG = 2
+
+
+class CityModel(middle.Model):
+    name = middle.field(type=str, min_length=3)
+    region = middle.field(type=RegionEnum)
+    size = middle.field(type=SizeEnum)
+    population = middle.field(type=int, minimum=0)
+    area = middle.field(type=float)
+    capital = middle.field(type=bool, default=False)
+    founded = middle.field(type=int, default=None)
+
+
+RECORDS = [
+    {
+        "name": "Blumenau",
+        "region": "TEMPERATE",
+        "size": 1,
+        "population": "352460",
+        "area": 519.8,
+    },
+    {
+        "name": "Manaus",
+        "region": "TROPICAL",
+        "size": 2,
+        "population": 2219580,
+        "area": 11401.1,
+        "capital": True,
+        "founded": 1669,
+    },
+]
+
+
+@pytest.fixture(params=[False, True], ids=["array", "numpy"])
+def use_numpy(request):
+    if request.param:
+        pytest.importorskip("numpy")
+    return request.param
+
+
+def test_model_array_rows(use_numpy):
+    cities = middle.ModelArray(CityModel, RECORDS, use_numpy=use_numpy)
+    assert len(cities) == 2
+    first, second = cities
+    assert first.name == "Blumenau"
+    assert first.region is RegionEnum.TEMPERATE
+    assert first.size is SizeEnum.SMALL
+    assert first.population == 352460
+    assert type(first.population) is int
+    assert first.area == 519.8
+    assert first.capital is False
+    assert first.founded is None
+    assert second.capital is True
+    assert second.founded == 1669
+    assert cities[-1].name == "Manaus"
+    assert middle.asdict(first) == middle.asdict(CityModel(RECORDS[0]))
+    assert repr(first) == repr(CityModel(RECORDS[0]))
+
+    inst = CityModel(second)
+    assert isinstance(inst, CityModel)
+    assert inst.name == "Manaus"
+
+    with pytest.raises(IndexError):
+        cities[2]
+
+
+def test_model_array_set_values(use_numpy):
+    cities = middle.ModelArray(CityModel, RECORDS, use_numpy=use_numpy)
+    city = cities[0]
+    city.population = "400000"
+    city.region = "TROPICAL"
+    assert cities[0].population == 400000
+    assert cities[0].region is RegionEnum.TROPICAL
+    assert cities.to_columns()["region"][0] == "TROPICAL"
+
+    with pytest.raises(ValidationError):
+        city.population = -1
+    with pytest.raises(ValidationError):
+        city.name = "x"
+    assert city.population == 400000
+
+
+def test_model_array_to_columns():
+    cities = middle.ModelArray(CityModel, RECORDS, use_numpy=False)
+    columns = cities.to_columns()
+    assert isinstance(columns["population"], array)
+    assert columns["population"].typecode == "q"
+    assert list(columns["size"]) == [1, 2]
+    assert columns["region"] == ["TEMPERATE", "TROPICAL"]
+    assert columns["founded"] == [None, 1669]
+    columns["area"][0] = 1.5
+    assert cities[0].area == 1.5
+
+
+def test_model_array_to_columns_numpy():
+    numpy = pytest.importorskip("numpy")
+    cities = middle.ModelArray(CityModel, RECORDS)
+    columns = cities.to_columns()
+    assert columns["population"].dtype == numpy.int64
+    assert columns["area"].dtype == numpy.float64
+    assert columns["capital"].dtype == numpy.bool_
+    assert columns["region"].dtype == object
+    assert columns["population"].sum() == 352460 + 2219580
+    columns["area"] *= 2
+    assert cities[0].area == 519.8 * 2
+    assert cities.to_columns()["area"] is columns["area"]
+
+
+def test_model_array_empty(use_numpy):
+    cities = middle.ModelArray(CityModel, [], use_numpy=use_numpy)
+    assert len(cities) == 0
+    assert list(cities) == []
+    assert len(cities.to_columns()["population"]) == 0
+
+
+def test_model_array_invalid():
+    with pytest.raises(ValidationError):
+        middle.ModelArray(CityModel, [dict(RECORDS[0], population=-1)])
+
+    class TagsModel(middle.Model):
+        tags = middle.field(type=t.List[str])
+
+    with pytest.raises(TypeError):
+        middle.ModelArray(TagsModel, [])
+
+
+class OptionalCityModel(middle.Model):
+    name = middle.field(type=t.Optional[str])
+    size = middle.field(type=t.Optional[SizeEnum])
+    population = middle.field(type=t.Optional[int])
+
+
+def test_model_array_optional(use_numpy):
+    cities = middle.ModelArray(
+        OptionalCityModel,
+        [
+            {"name": "Blumenau", "size": 1, "population": "352460"},
+            {"name": None, "size": None, "population": None},
+        ],
+        use_numpy=use_numpy,
+    )
+    assert cities[0].name == "Blumenau"
+    assert cities[0].size is SizeEnum.SMALL
+    assert cities[0].population == 352460
+    assert cities[1].name is None
+    assert cities[1].size is None
+    assert cities[1].population is None
+    cities[1].size = SizeEnum.BIG
+    assert cities[1].size is SizeEnum.BIG
+    assert list(cities.to_columns()["population"]) == [352460, None]
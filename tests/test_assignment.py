@@ -0,0 +1,73 @@
+import typing as t
+
+import pytest
+
+import middle
+
+from middle.exceptions import ValidationError
+
+
+class CityModel(middle.Model):
+    name = middle.field(type=str, min_length=3)
+
+
+class GameModel(middle.Model):
+    __model_options__ = {"validate_assignment": True}
+    name = middle.field(type=str, max_length=30)
+    score = middle.field(type=float, minimum=0)
+    cities = middle.field(type=t.List[CityModel], default=None)
+    _secret = middle.field(type=str, default=None)
+
+
+class CompiledGameModel(GameModel):
+    __model_options__ = {"compiled": True}
+
+
+class SlottedGameModel(GameModel):
+    __model_options__ = {"slots": True}
+
+
+class LazyGameModel(GameModel):
+    __model_options__ = {"lazy": True}
+
+
+@pytest.mark.parametrize(
+    "model",
+    [GameModel, CompiledGameModel, SlottedGameModel, LazyGameModel],
+)
+def test_validate_assignment(model):
+    assert model.__model_options__["validate_assignment"] is True
+    inst = model(name="foo", score="1")
+    inst.score = "2.5"
+    assert inst.score == 2.5
+    inst.cities = [{"name": "Blumenau"}]
+    assert isinstance(inst.cities[0], CityModel)
+    inst._secret = 42
+    assert inst._secret == "42"
+
+    with pytest.raises(ValidationError):
+        inst.score = -1.0
+    with pytest.raises(TypeError):
+        inst.score = "abc"
+    with pytest.raises(ValidationError):
+        inst.cities = [{"name": "x"}]
+    assert inst.score == 2.5
+    assert inst.cities[0].name == "Blumenau"
+
+    assert middle.evolve(inst, score=3.0).score == 3.0
+
+
+def test_validate_assignment_disabled():
+    class PlainModel(middle.Model):
+        score = middle.field(type=float, minimum=0)
+
+    inst = PlainModel(score=1.0)
+    inst.score = "abc"
+    assert inst.score == "abc"
+
+
+def test_validate_assignment_frozen():
+    with pytest.raises(TypeError):
+
+        class FrozenModel(GameModel):
+            __model_options__ = {"frozen": True}
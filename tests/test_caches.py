@@ -0,0 +1,201 @@
+import gc
+import sys
+import threading
+import typing as t
+import weakref
+
+import pytest
+
+import middle
+
+from middle.caches import cached
+
+
+class CityModel(middle.Model):
+    name = middle.field(type=str)
+
+
+class GameModel(middle.Model):
+    name = middle.field(type=str)
+    cities = middle.field(type=t.List[CityModel])
+
+
+def test_caches_info():
+    names = middle.caches.names()
+    for name in ("get_type", "converter", "value_of", "asdict", "dumps"):
+        assert name in names
+
+    middle.caches.clear("asdict")
+    inst = GameModel(name="foo", cities=[{"name": "bar"}, {"name": "baz"}])
+    middle.asdict(inst)
+    middle.asdict(inst)
+    info = middle.caches.info("asdict")
+    assert info.hits == 1
+    assert info.misses == 2
+    assert info.evictions == 0
+    assert info.maxsize is None
+    assert info.currsize == 2
+    assert middle.caches.info()["asdict"] == info
+    assert middle.caches.memory_estimate("asdict") > 0
+    assert set(middle.caches.memory_estimate()) == set(names)
+
+    middle.caches.clear("asdict", "dumps")
+    assert middle.caches.info("asdict") == (0, 0, 0, None, 0)
+    assert middle.asdict(inst)["cities"] == [{"name": "bar"}, {"name": "baz"}]
+
+    with pytest.raises(KeyError):
+        middle.caches.info("foo")
+
+
+def test_caches_bounded():
+    calls = []
+
+    @cached("test_caches_bounded", maxsize=2)
+    def double(value):
+        calls.append(value)
+        return value * 2
+
+    try:
+        assert [double(i) for i in (1, 2, 1, 3)] == [2, 4, 2, 6]
+        assert calls == [1, 2, 3]
+        assert double.cache_info() == (1, 3, 1, 2, 2)
+        assert double(1) == 2  # used after 2, so 2 was dropped instead
+        assert double(2) == 4
+        assert calls == [1, 2, 3, 2]
+
+        middle.caches.set_maxsize("test_caches_bounded", 1)
+        assert middle.caches.info("test_caches_bounded").currsize == 1
+        middle.caches.set_maxsize("test_caches_bounded", None)
+        assert [double(i) for i in range(10)] == [i * 2 for i in range(10)]
+        assert double.cache_info().currsize == 10
+
+        with pytest.raises(ValueError):
+            middle.caches.set_maxsize("test_caches_bounded", -1)
+    finally:
+        middle.caches._caches.pop("test_caches_bounded")
+
+
+def test_caches_bounded_classes():
+    # classes keep what is cached for them, but are still evicted in order
+    @cached("test_caches_bounded_classes", maxsize=2)
+    def name_of(cls):
+        return cls.__name__
+
+    try:
+        classes = [type("Class{}".format(i), (), {}) for i in range(3)]
+        name_of(classes[0])
+        name_of(classes[1])
+        assert name_of(classes[0]) == "Class0"
+        name_of(classes[2])
+        assert name_of.cache_info() == (1, 3, 1, 2, 2)
+        assert "__middle_cache__" in classes[0].__dict__
+        assert name_of not in classes[1].__middle_cache__
+        name_of(classes[0])
+        assert name_of.cache_info().hits == 2
+    finally:
+        middle.caches._caches.pop("test_caches_bounded_classes")
+
+
+def test_caches_bounded_threads():
+    # hits move entries around and misses evict others, in any thread
+    @cached("test_caches_bounded_threads", maxsize=4)
+    def same(key):
+        return key
+
+    keys = [int, str, float, bool, bytes, list, dict, set]
+    keys += [type("Class{}".format(i), (), {}) for i in range(8)]
+    errors = []
+
+    def target(step):
+        try:
+            for i in range(5000):
+                key = keys[(i * step) % len(keys)]
+                assert same(key) is key
+        except Exception as e:  # pragma: no cover
+            errors.append(e)
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [
+            threading.Thread(target=target, args=(step,))
+            for step in range(1, 9)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(interval)
+        middle.caches._caches.pop("test_caches_bounded_threads")
+    assert errors == []
+    assert same.cache_info().currsize <= 4
+
+
+def test_caches_dispatch():
+    middle.caches.clear()
+    assert middle.converter(str) is middle.converter(str)
+    assert middle.caches.info("converter").misses == 1
+    assert middle.caches.info("converter").hits == 1
+    assert middle.caches.info("converter.types").misses == 1
+    assert middle.converter.dispatch_info().misses == 1
+
+
+def test_caches_dont_keep_models_alive():
+    def create(i):
+        class InnerModel(middle.Model):
+            value = middle.field(type=int)
+
+        class OuterModel(middle.Model):
+            name = middle.field(type=str)
+            inner = middle.field(type=InnerModel)
+
+        inst = OuterModel(name="foo", inner={"value": i})
+        assert middle.asdict(inst) == {"name": "foo", "inner": {"value": i}}
+        data = middle.json.dumps(inst)
+        assert middle.asdict(middle.json.loads(OuterModel, data)) == {
+            "name": "foo",
+            "inner": {"value": i},
+        }
+        assert OuterModel.construct(name="bar", inner=inst.inner).name == "bar"
+        assert OuterModel.partial({"name": "bar"}, ["name"]).name == "bar"
+        assert middle.evolve(inst, name="bar").name == "bar"
+        return weakref.ref(OuterModel), weakref.ref(InnerModel)
+
+    refs = [create(0)]  # anything else is cached by now
+    gc.collect()
+    before = middle.caches.info()
+    refs += [create(i) for i in range(1, 100)]
+    gc.collect()
+    gc.collect()
+    assert all(ref() is None for pair in refs for ref in pair)
+    for name, info in middle.caches.info().items():
+        assert info.currsize <= before[name].currsize
+
+
+def test_caches_subclasses():
+    class BaseModel(middle.Model):
+        name = middle.field(type=str)
+
+    class SubModel(BaseModel):
+        value = middle.field(type=int)
+
+    assert middle.asdict(BaseModel(name="foo")) == {"name": "foo"}
+    # nothing cached for the base class is used for the subclass
+    inst = SubModel(name="foo", value=1)
+    assert middle.asdict(inst) == {"name": "foo", "value": 1}
+    assert middle.json.dumps(inst) == '{"name":"foo","value":1}'
+
+    class SubCityModel(CityModel):
+        population = middle.field(type=int)
+
+    game = GameModel(name="foo", cities=[{"name": "bar"}])
+    game.cities.append(SubCityModel(name="baz", population=1))
+    assert middle.asdict(game)["cities"] == [
+        {"name": "bar"},
+        {"name": "baz", "population": 1},
+    ]
+    assert middle.json.dumps(game) == (
+        '{"name":"foo","cities":[{"name":"bar"},'
+        '{"name":"baz","population":1}]}'
+    )
@@ -1,4 +1,5 @@
 import datetime
+import sys
 import typing as t
 
 from decimal import Decimal
@@ -44,6 +45,20 @@ def test_get_type(type_, expected):
     assert middle.get_type(type_) == expected
 
 
+@pytest.mark.skipif(sys.version_info < (3, 9), reason="requires python 3.9+")
+def test_get_type_builtin_generics():
+    assert middle.get_type(list[int]) is t.List
+    assert middle.get_type(set[str]) is t.Set
+    assert middle.get_type(dict[str, float]) is t.Dict
+    assert middle.get_type(tuple[int, str]) is t.Tuple
+
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="requires python 3.10+")
+def test_get_type_union_operator():
+    assert middle.get_type(int | None) is t.Union
+    assert middle.get_type(int | str) is t.Union
+
+
 def test_get_enum():
     class RegionEnum(str, Enum):
         TROPICAL = "TROPICAL"
@@ -0,0 +1,241 @@
+import typing as t
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum, IntEnum, unique
+
+import attr
+import pytest
+
+import middle
+
+from middle.exceptions import ValidationError
+
+
+@unique
+class PlatformEnum(str, Enum):
+    XBOX1 = "XBOX1"
+    PLAYSTATION4 = "PLAYSTATION4"
+    PC = "PC"
+
+
+@unique
+class LanguageEnum(IntEnum):
+    ENGLISH = 1
+    JAPANESE = 2
+
+
+def _models(compiled):
+    class CityModel(middle.Model):
+        __model_options__ = {"compiled": compiled}
+        name = middle.field(type=str, min_length=3)
+        population = middle.field(type=int, minimum=0, default=None)
+
+    class GameModel(middle.Model):
+        __model_options__ = {"compiled": compiled}
+        name = middle.field(type=str, max_length=30)
+        platform = middle.field(type=PlatformEnum)
+        score = middle.field(
+            type=float, minimum=0, maximum=10, exclusive_maximum=True
+        )
+        resolution_tested = middle.field(type=str, pattern=r"^\d+x\d+$")
+        genre = middle.field(type=t.List[str], min_items=1, unique_items=True)
+        rating = middle.field(type=t.Dict[str, float], max_properties=3)
+        players = middle.field(type=t.Set[str])
+        language = middle.field(type=LanguageEnum)
+        awesome_city = middle.field(type=CityModel)
+        price = middle.field(type=Decimal, multiple_of=0.01, default=None)
+        released = middle.field(type=date, default=None)
+        updated = middle.field(type=datetime, default=None)
+        cities = middle.field(
+            type=t.List[CityModel], default=attr.Factory(list)
+        )
+
+    return GameModel
+
+
+DATA = {
+    "name": "Cities: Skylines",
+    "platform": "PC",
+    "score": 9.0,
+    "resolution_tested": "1920x1080",
+    "genre": ["Simulators", "City Building"],
+    "rating": {"IGN": 8.5, "Gamespot": 8.0, "Steam": 4.5},
+    "players": ["Flux", "strictoaster"],
+    "language": 1,
+    "awesome_city": {"name": "Blumenau"},
+}
+
+
+@pytest.fixture(scope="module")
+def models():
+    return _models(False), _models(True)
+
+
+def test_compiled_init_is_generated(models):
+    legacy, compiled = models
+    assert compiled.__model_options__["compiled"] is True
+    assert legacy.__model_options__["compiled"] is False
+    assert compiled.__init__.__code__.co_filename.startswith(
+        "<middle compiled init"
+    )
+    assert not legacy.__init__.__code__.co_filename.startswith(
+        "<middle compiled init"
+    )
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        pytest.param({}, id="plain"),
+        pytest.param({"price": "10.25", "released": "2015-03-10"}, id="str"),
+        pytest.param(
+            {"updated": datetime(2018, 7, 18, 14, tzinfo=timezone.utc)},
+            id="datetime",
+        ),
+        pytest.param(
+            {"cities": [{"name": "London"}, {"name": "Tokyo"}]}, id="nested"
+        ),
+        pytest.param({"platform": PlatformEnum.XBOX1}, id="enum_instance"),
+        pytest.param({"genre": ("Simulators",)}, id="tuple_as_list"),
+    ],
+)
+def test_compiled_parity(models, changes):
+    legacy, compiled = models
+    data = dict(DATA, **changes)
+    legacy_inst = legacy(**data)
+    compiled_inst = compiled(**data)
+    for f in attr.fields(legacy):
+        legacy_value = getattr(legacy_inst, f.name)
+        compiled_value = getattr(compiled_inst, f.name)
+        if attr.has(type(legacy_value)):
+            assert middle.asdict(legacy_value) == middle.asdict(compiled_value)
+        elif f.name == "cities":
+            assert [middle.asdict(c) for c in legacy_value] == [
+                middle.asdict(c) for c in compiled_value
+            ]
+        else:
+            assert legacy_value == compiled_value
+            assert type(legacy_value) is type(compiled_value)
+
+
+@pytest.mark.parametrize(
+    "changes,exc",
+    [
+        pytest.param({"name": "x" * 31}, ValidationError, id="max_length"),
+        pytest.param({"platform": "SEGA"}, ValueError, id="enum_value"),
+        pytest.param({"platform": ["PC"]}, ValueError, id="enum_unhashable"),
+        pytest.param({"score": -1.0}, ValidationError, id="minimum"),
+        pytest.param({"score": 10.0}, ValidationError, id="exclusive_max"),
+        pytest.param({"score": 5}, TypeError, id="int_to_float"),
+        pytest.param({"resolution_tested": "big"}, ValidationError, id="re"),
+        pytest.param({"genre": []}, ValidationError, id="min_items"),
+        pytest.param({"genre": ["a", "a"]}, ValidationError, id="unique"),
+        pytest.param(
+            {"rating": {"a": 1.0, "b": 1.0, "c": 1.0, "d": 1.0}},
+            ValidationError,
+            id="max_properties",
+        ),
+        pytest.param(
+            {"awesome_city": {"name": "x"}}, ValidationError, id="sub"
+        ),
+        pytest.param(
+            {"awesome_city": {"name": "Blumenau", "population": -1}},
+            ValidationError,
+            id="sub_minimum",
+        ),
+        pytest.param({"price": "0.001"}, ValidationError, id="multiple_of"),
+        pytest.param({"name": None}, TypeError, id="none"),
+        pytest.param({"language": None}, TypeError, id="enum_none"),
+    ],
+)
+def test_compiled_parity_errors(models, changes, exc):
+    legacy, compiled = models
+    data = dict(DATA, **changes)
+    with pytest.raises(exc) as legacy_exc:
+        legacy(**data)
+    with pytest.raises(exc) as compiled_exc:
+        compiled(**data)
+    assert legacy_exc.value.args[0] == compiled_exc.value.args[0]
+
+
+def test_compiled_missing_argument(models):
+    _, compiled = models
+    data = DATA.copy()
+    data.pop("name")
+    with pytest.raises(TypeError):
+        compiled(**data)
+
+
+def test_compiled_options_are_inherited():
+    class BaseModel(middle.Model):
+        __model_options__ = {"compiled": True}
+        name = middle.field(type=str)
+
+    class ChildModel(BaseModel):
+        age = middle.field(type=int, minimum=0)
+
+    class NotCompiledModel(ChildModel):
+        __model_options__ = {"compiled": False}
+
+    inst = ChildModel(name="foo", age="42")
+    assert inst.name == "foo"
+    assert inst.age == 42
+    assert ChildModel.__model_options__["compiled"] is True
+    assert NotCompiledModel.__model_options__["compiled"] is False
+
+    with pytest.raises(ValidationError):
+        ChildModel(name="foo", age=-1)
+
+
+def test_compiled_unknown_option():
+    with pytest.raises(TypeError):
+
+        class TestModel(middle.Model):
+            __model_options__ = {"compiled": True, "foo": "bar"}
+            name = middle.field(type=str)
+
+
+def test_compiled_post_init_and_kw_only():
+    class TestModel(middle.Model):
+        __model_options__ = {"compiled": True}
+        __attr_s_kwargs__ = {"cmp": False, "kw_only": True}
+        name = middle.field(type=str)
+        age = middle.field(type=int, default=18)
+
+        def __attrs_post_init__(self):
+            self.name = self.name.upper()
+
+    inst = TestModel(name="foo")
+    assert inst.name == "FOO"
+    assert inst.age == 18
+
+    with pytest.raises(TypeError):
+        TestModel.__init__(object.__new__(TestModel), "foo")
+
+
+def test_compiled_run_validators():
+    class TestModel(middle.Model):
+        __model_options__ = {"compiled": True}
+        value = middle.field(type=int, maximum=10)
+
+    with pytest.raises(ValidationError):
+        TestModel(value=42)
+
+    attr.set_run_validators(False)
+    try:
+        assert TestModel(value=42).value == 42
+    finally:
+        attr.set_run_validators(True)
+
+
+def test_compiled_config():
+    class TestModel(middle.Model):
+        __model_options__ = {"compiled": True}
+        value = middle.field(type=str)
+
+    assert TestModel(value=3.14).value == "3.14"
+
+    with middle.config.temp(str_method=False):
+        with pytest.raises(TypeError):
+            TestModel(value=3.14)
@@ -0,0 +1,193 @@
+import threading
+import typing as t
+
+import attr
+import pytest
+
+import middle
+
+from middle.exceptions import ValidationError
+from middle.model import ModelMeta, _deferred
+
+
+def _models():
+    class CityModel(middle.Model):
+        __model_options__ = {"deferred": True}
+        name: str = middle.field(min_length=3)
+        population: int = middle.field(default=0)
+
+    class StateModel(middle.Model):
+        __model_options__ = {"deferred": True}
+        code: str
+        cities: t.List[CityModel] = middle.field(default=[])
+
+    return CityModel, StateModel
+
+
+def _is_compiled(model):
+    return type(model) is ModelMeta
+
+
+def test_deferred_not_compiled():
+    CityModel, StateModel = _models()
+    assert not _is_compiled(CityModel)
+    assert not _is_compiled(StateModel)
+    assert isinstance(CityModel, ModelMeta)
+    assert issubclass(CityModel, middle.Model)
+    assert "__attrs_attrs__" not in CityModel.__dict__
+    assert CityModel in _deferred
+    with pytest.raises(AttributeError):
+        CityModel.foo
+
+
+def test_deferred_compiled_when_instantiated():
+    CityModel, StateModel = _models()
+    city = CityModel(name="Blumenau")
+    assert _is_compiled(CityModel)
+    assert CityModel not in _deferred
+    assert city.name == "Blumenau"
+    assert city.population == 0
+    with pytest.raises(ValidationError):
+        CityModel(name="X")
+
+    state = StateModel({"code": "SC", "cities": [{"name": "Joinville"}]})
+    assert _is_compiled(StateModel)
+    assert middle.asdict(state.cities[0]) == {
+        "name": "Joinville",
+        "population": 0,
+    }
+
+
+def test_deferred_compiled_by_attrs():
+    CityModel, _ = _models()
+    assert attr.has(CityModel)
+    assert _is_compiled(CityModel)
+    assert [f.name for f in attr.fields(CityModel)] == ["name", "population"]
+
+
+def test_deferred_nested_compiled_by_parent():
+    CityModel, StateModel = _models()
+    state = StateModel(code="SC", cities=[{"name": "Blumenau"}])
+    assert _is_compiled(CityModel)
+    assert isinstance(state.cities[0], CityModel)
+
+
+@pytest.mark.parametrize("option", ["compiled", "frozen", "lazy"])
+def test_deferred_with_options(option):
+    class CityModel(middle.Model):
+        __model_options__ = {"deferred": True, option: True}
+        name: str = middle.field(min_length=3)
+        population: int = middle.field(default=0)
+
+    assert not _is_compiled(CityModel)
+    city = CityModel(name="Blumenau", population="1")
+    assert city.population == 1
+    assert middle.asdict(city) == {"name": "Blumenau", "population": 1}
+    assert CityModel.__model_options__[option] is True
+
+
+@pytest.mark.parametrize(
+    "use",
+    [
+        lambda m: middle.asdict(m(name="Blumenau")),
+        lambda m: middle.asdict_many(m.from_many([{"name": "Blumenau"}])),
+        lambda m: middle.dumps(m(name="Blumenau")),
+        lambda m: middle.loads(m, '{"name": "Blumenau"}'),
+        lambda m: m.loads('{"name": "Blumenau"}'),
+        lambda m: list(m.from_many([{"name": "Blumenau"}])),
+        lambda m: m.construct(name="Blumenau"),
+        lambda m: m.partial({"name": "Blumenau", "population": 1}, ["name"]),
+        lambda m: middle.converter(m)({"name": "Blumenau"}),
+    ],
+    ids=[
+        "asdict",
+        "asdict_many",
+        "dumps",
+        "loads",
+        "model_loads",
+        "from_many",
+        "construct",
+        "partial",
+        "converter",
+    ],
+)
+def test_deferred_api(use):
+    CityModel, _ = _models()
+    use(CityModel)
+    assert _is_compiled(CityModel)
+
+
+def test_deferred_from_many():
+    # with a class still deferred
+    CityModel, _ = _models()
+    cities = list(middle.model._from_many(CityModel, [{"name": "Blumenau"}]))
+    assert _is_compiled(CityModel)
+    assert [c.name for c in cities] == ["Blumenau"]
+
+
+def test_deferred_subclasses():
+    CityModel, _ = _models()
+
+    class CapitalModel(CityModel):
+        state: str = middle.field(default="SC")
+
+    assert not _is_compiled(CapitalModel)
+    assert CapitalModel.__model_options__["deferred"] is True
+    capital = CapitalModel(name="Florianópolis", state="SC")
+    assert _is_compiled(CapitalModel)
+    assert _is_compiled(CityModel)
+    assert capital.population == 0
+    assert isinstance(capital, CityModel)
+
+
+def test_deferred_base_compiled_by_eager_subclass():
+    CityModel, _ = _models()
+
+    class CapitalModel(CityModel):
+        __model_options__ = {"deferred": False}
+        state: str = middle.field(default="SC")
+
+    assert _is_compiled(CityModel)
+    assert _is_compiled(CapitalModel)
+    assert middle.asdict(CapitalModel(name="Florianópolis", state="SC")) == {
+        "name": "Florianópolis",
+        "population": 0,
+        "state": "SC",
+    }
+
+
+def test_compile_all():
+    CityModel, StateModel = _models()
+    middle.compile_all()
+    assert _is_compiled(CityModel)
+    assert _is_compiled(StateModel)
+    assert CityModel not in _deferred
+    assert StateModel not in _deferred
+    middle.compile_all()  # nothing left to do
+    assert StateModel(code="SC").cities == []
+
+
+def test_deferred_compiled_once_between_threads():
+    CityModel, _ = _models()
+    barrier = threading.Barrier(4)
+    results = []
+
+    def target():
+        barrier.wait()
+        results.append(CityModel(name="Blumenau"))
+
+    threads = [threading.Thread(target=target) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 4
+    assert len(attr.fields(CityModel)) == 2
+
+
+def test_deferred_slots():
+    with pytest.raises(TypeError):
+
+        class CityModel(middle.Model):
+            __model_options__ = {"deferred": True, "slots": True}
+            name: str
@@ -0,0 +1,73 @@
+import pickle
+import typing as t
+
+import attr
+import pytest
+
+import middle
+
+
+class CityModel(middle.Model):
+    __model_options__ = {"frozen": True}
+    name = middle.field(type=str, min_length=3)
+    codes = middle.field(type=t.Tuple[int], default=(0,))
+
+
+class CompiledCityModel(CityModel):
+    __model_options__ = {"compiled": True}
+
+
+class LazyCityModel(CityModel):
+    __model_options__ = {"lazy": True}
+
+
+class SlottedCityModel(CityModel):
+    __model_options__ = {"slots": True}
+
+
+@pytest.mark.parametrize(
+    "model",
+    [CityModel, CompiledCityModel, LazyCityModel, SlottedCityModel],
+)
+def test_frozen(model):
+    assert model.__model_options__["frozen"] is True
+    a = model(name="Blumenau", codes=["1"])
+    b = model({"name": "Blumenau", "codes": (1,)})
+    c = model(name="Manaus")
+    assert a == b
+    assert a is not b
+    assert a != c
+    assert hash(a) == hash(b)
+    assert len({a, b, c}) == 2
+    assert {a: "foo"}[b] == "foo"
+
+    with pytest.raises(attr.exceptions.FrozenInstanceError):
+        a.name = "Manaus"
+
+    assert model.loads(middle.dumps(a)) == a
+    unpickled = pickle.loads(pickle.dumps(a))
+    assert unpickled == a
+    assert hash(unpickled) == hash(a)
+
+
+def test_frozen_hash_is_cached():
+    inst = CityModel(name="Blumenau")
+    assert inst._attrs_cached_hash is None
+    value = hash(inst)
+    assert inst._attrs_cached_hash == value
+
+
+def test_frozen_different_models():
+    assert CityModel(name="Blumenau") != CompiledCityModel(name="Blumenau")
+
+
+def test_frozen_inheritance():
+    with pytest.raises(TypeError):
+
+        class NotFrozenModel(CityModel):
+            __model_options__ = {"frozen": False}
+
+    class PlainModel(middle.Model):
+        name = middle.field(type=str)
+
+    assert PlainModel(name="foo") != PlainModel(name="foo")
@@ -0,0 +1,259 @@
+import io
+import json
+import typing as t
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum, IntEnum, unique
+
+import pytest
+
+import middle
+
+from middle.json import _encoder_fn
+
+
+@unique
+class RegionEnum(str, Enum):
+    TROPICAL = "TROPICAL"
+    TEMPERATE = "TEMPERATE"
+
+
+@unique
+class SizeEnum(IntEnum):
+    SMALL = 1
+    BIG = 2
+
+
+class CityModel(middle.Model):
+    name = middle.field(type=str)
+    region = middle.field(type=RegionEnum, default=None)
+
+
+class TripModel(middle.Model):
+    city = middle.field(type=CityModel)
+    budget = middle.field(type=Decimal)
+    departure = middle.field(type=date)
+    arrival = middle.field(type=datetime)
+    size = middle.field(type=SizeEnum)
+    rating = middle.field(type=float)
+    nights = middle.field(type=int)
+    active = middle.field(type=bool)
+    tags = middle.field(type=t.Set[str])
+    prices = middle.field(type=t.List[Decimal])
+    matrix = middle.field(type=t.List[t.List[float]])
+    stops = middle.field(type=t.List[CityModel])
+    by_region = middle.field(type=t.Dict[RegionEnum, t.List[CityModel]])
+    scores = middle.field(type=t.Dict[str, float])
+    pair = middle.field(type=t.Tuple[int, Decimal])
+    returning = middle.field(type=date, default=None)
+
+
+DATA = {
+    "city": {"name": 'São Paulo "SP"\n', "region": "TROPICAL"},
+    "budget": "1200.50",
+    "departure": "2018-07-18",
+    "arrival": datetime(2018, 7, 19, 12, tzinfo=timezone.utc),
+    "size": 2,
+    "rating": 4.5,
+    "nights": 3,
+    "active": True,
+    "tags": ["beer"],
+    "prices": ["1.5", "2"],
+    "matrix": [[1.5], [2.5, 3.0]],
+    "stops": [{"name": "Blumenau"}],
+    "by_region": {"TEMPERATE": [{"name": "Blumenau"}]},
+    "scores": {"food": 9.5},
+    "pair": (1, "1.5"),
+}
+
+
+def _expected(inst):
+    # the same as ``json.dumps(middle.asdict(inst))``, with sets as lists
+    return json.loads(
+        json.dumps(
+            middle.asdict(inst),
+            default=lambda v: list(v) if isinstance(v, set) else v,
+        )
+    )
+
+
+def test_dumps():
+    inst = TripModel(**DATA)
+    data = middle.dumps(inst)
+    assert isinstance(data, str)
+    assert json.loads(data) == _expected(inst)
+    assert json.loads(data)["tags"] == ["beer"]
+    assert json.loads(data)["returning"] is None
+    assert "São Paulo" in data
+
+
+def test_dumps_none_values():
+    inst = TripModel(**DATA)
+    for f in ("budget", "departure", "arrival", "size", "tags", "stops"):
+        setattr(inst, f, None)
+    assert json.loads(middle.dumps(inst)) == _expected(inst)
+
+
+def test_dumps_json_backend(monkeypatch):
+    monkeypatch.setattr(
+        middle.json,
+        "_dumps_native",
+        json.JSONEncoder(
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=middle.json._json_default,
+        ).encode,
+    )
+    _encoder_fn.cache_clear()
+    try:
+        inst = TripModel(**DATA)
+        assert json.loads(middle.dumps(inst)) == _expected(inst)
+    finally:
+        _encoder_fn.cache_clear()
+
+
+def test_dump():
+    inst = CityModel(name="Blumenau", region="TEMPERATE")
+    text, binary = io.StringIO(), io.BytesIO()
+    middle.dump(inst, text)
+    middle.dump(inst, binary)
+    assert text.getvalue() == '{"name":"Blumenau","region":"TEMPERATE"}'
+    assert binary.getvalue() == text.getvalue().encode()
+
+
+def test_dumps_untyped_and_custom_values():
+    class Point:
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+    class TestModel(middle.Model):
+        value = middle.field(type=float)
+
+    assert json.loads(middle.dumps(TestModel(value=1.5))) == {"value": 1.5}
+    assert middle.dumps(TestModel(value=float("nan"))) in (
+        '{"value":null}',
+        '{"value":NaN}',
+    )
+
+    middle.value_of.register(Point, lambda type_: lambda p: [p.x, p.y])
+    try:
+        data = middle.json._dumps_native(
+            [Decimal("1.5"), {RegionEnum.TROPICAL}, Point(1, 2)]
+        )
+        assert json.loads(data) == [1.5, ["TROPICAL"], [1, 2]]
+        with pytest.raises(TypeError):
+            middle.json._dumps_native([object()])
+    finally:
+        middle.value_of.unregister(Point)
+
+
+RAW = json.dumps(
+    dict(DATA, arrival="2018-07-19T12:00:00+00:00", pair=[1, "1.5"])
+).encode()
+
+
+def test_loads():
+    inst = TripModel(**DATA)
+    raw = RAW
+    loaded = TripModel.loads(raw)
+    assert isinstance(loaded, TripModel)
+    assert middle.asdict(loaded) == middle.asdict(inst)
+    assert isinstance(loaded.stops[0], CityModel)
+    assert isinstance(loaded.by_region[RegionEnum.TEMPERATE][0], CityModel)
+    assert loaded.tags == {"beer"}
+
+    assert middle.asdict(middle.loads(TripModel, raw.decode())) == (
+        middle.asdict(inst)
+    )
+    assert middle.asdict(middle.load(TripModel, io.BytesIO(raw))) == (
+        middle.asdict(inst)
+    )
+
+
+def test_loads_skips_undeclared_keys():
+    raw = json.dumps(
+        {
+            "name": "Blumenau",
+            "population": 352460,
+            "region": "TEMPERATE",
+            "nested": {"foo": [1, 2, 3]},
+        }
+    )
+    city = CityModel.loads(raw)
+    assert city.name == "Blumenau"
+    assert city.region is RegionEnum.TEMPERATE
+    assert not hasattr(city, "population")
+
+    data = json.loads(RAW)
+    data["city"]["foo"] = "bar"
+    data["stops"][0]["foo"] = "bar"
+    data["by_region"]["TEMPERATE"][0]["foo"] = "bar"
+    data["foo"] = "bar"
+    assert TripModel.loads(json.dumps(data)).city.name == DATA["city"]["name"]
+
+
+class PlanModel(middle.Model):
+    city = middle.field(type=t.Optional[CityModel])
+    stops = middle.field(type=t.Optional[t.List[CityModel]])
+
+
+def test_loads_skips_undeclared_keys_optional():
+    raw = json.dumps(
+        {
+            "city": {"name": "Blumenau", "extra": 1},
+            "stops": [{"name": "Manaus", "extra": 2}],
+        }
+    )
+    plan = PlanModel.loads(raw)
+    assert plan.city.name == "Blumenau"
+    assert [c.name for c in plan.stops] == ["Manaus"]
+
+    plan = PlanModel.loads('{"city": null, "stops": null}')
+    assert plan.city is None
+    assert plan.stops is None
+    city = middle.loads(t.Optional[CityModel], '{"name": "Blumenau", "a": 1}')
+    assert city.name == "Blumenau"
+
+
+class AccountModel(middle.Model):
+    name = middle.field(type=str)
+    _secret = middle.field(type=str, default=None)
+
+
+def test_loads_private_fields():
+    raw = '{"name": "foo", "secret": "x", "_secret": "y"}'
+    assert AccountModel.loads(raw)._secret == "x"
+
+    inst = AccountModel(name="foo", secret="x")
+    data = middle.dumps(inst)
+    assert json.loads(data) == {"name": "foo", "secret": "x"}
+    assert AccountModel.loads(data)._secret == "x"
+    assert AccountModel(**json.loads(data))._secret == "x"
+
+    fileobj = io.StringIO()
+    middle.stream.write_ndjson(fileobj, [inst, inst])
+    fileobj.seek(0)
+    loaded = list(middle.stream.read_ndjson(AccountModel, fileobj))
+    assert [a._secret for a in loaded] == ["x", "x"]
+
+
+def test_loads_errors():
+    with pytest.raises(TypeError):
+        CityModel.loads("{}")  # missing name
+    with pytest.raises(TypeError):
+        CityModel.loads("[]")
+    with pytest.raises(TypeError):
+        CityModel.loads("null")
+    with pytest.raises(ValueError):
+        CityModel.loads('{"name": "Blumenau", "region": "ARCTIC"}')
+    with pytest.raises(ValueError):
+        CityModel.loads("{not json")
+
+
+def test_loads_types():
+    raw = '[{"name": "Blumenau", "foo": 1}, {"name": "Manaus"}]'
+    cities = middle.loads(t.List[CityModel], raw)
+    assert [c.name for c in cities] == ["Blumenau", "Manaus"]
+    assert middle.loads(t.Dict[str, int], '{"a": "1"}') == {"a": 1}
+    assert middle.loads(date, '"2018-07-18"') == date(2018, 7, 18)
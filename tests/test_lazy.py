@@ -0,0 +1,191 @@
+import pickle
+import typing as t
+
+import attr
+import pytest
+
+import middle
+
+from middle.exceptions import ValidationError
+
+
+class CityModel(middle.Model):
+    name = middle.field(type=str, min_length=3)
+
+
+class GameModel(middle.Model):
+    __model_options__ = {"lazy": True}
+    name = middle.field(type=str, max_length=30)
+    score = middle.field(type=float, minimum=0)
+    genre = middle.field(type=t.List[str], min_items=1)
+    city = middle.field(type=CityModel)
+    players = middle.field(type=int, default=None)
+    tags = middle.field(type=t.Set[str], default=attr.Factory(set))
+
+
+DATA = {
+    "name": "Cities: Skylines",
+    "score": "9.0",
+    "genre": ["Simulators"],
+    "city": {"name": "Blumenau"},
+}
+
+
+def test_lazy_conversion():
+    inst = GameModel(**DATA)
+    assert "score" not in inst.__dict__
+    assert inst.score == 9.0
+    assert inst.__dict__["score"] == 9.0
+    assert inst.score is inst.score
+    assert isinstance(inst.city, CityModel)
+    assert inst.players is None
+    assert inst.tags == set()
+    assert middle.asdict(inst) == {
+        "name": "Cities: Skylines",
+        "score": 9.0,
+        "genre": ["Simulators"],
+        "city": {"name": "Blumenau"},
+        "players": None,
+        "tags": set(),
+    }
+
+
+def test_lazy_validation():
+    inst = GameModel(**dict(DATA, score=-1.0, city={"name": "x"}))
+    assert inst.name == "Cities: Skylines"
+    with pytest.raises(ValidationError):
+        inst.score
+    with pytest.raises(ValidationError):
+        inst.score  # still not valid
+    with pytest.raises(ValidationError):
+        inst.city
+    with pytest.raises(TypeError):
+        GameModel(name="foo")  # required arguments are still required
+
+
+def test_lazy_set_and_pickle():
+    inst = GameModel(**DATA)
+    inst.score = 1.0
+    assert inst.score == 1.0
+    loaded = pickle.loads(pickle.dumps(inst))
+    assert loaded.score == 1.0
+    assert loaded.genre == ["Simulators"]
+
+
+def test_lazy_options():
+    class ChildModel(GameModel):
+        extra = middle.field(type=int, default=0)
+
+        def __attrs_post_init__(self):
+            self.post_init = True
+
+    class EagerModel(GameModel):
+        __model_options__ = {"lazy": False}
+
+    inst = ChildModel(**dict(DATA, extra="1"))
+    assert inst.post_init is True
+    assert inst.__dict__["__middle_raw__"]["extra"] == "1"
+    assert inst.extra == 1
+    assert ChildModel.__model_options__["lazy"] is True
+
+    with pytest.raises(ValidationError):
+        EagerModel(**dict(DATA, score=-1.0))
+    assert EagerModel(**DATA).__dict__["score"] == 9.0
+
+
+def test_lazy_arguments():
+    class TestModel(middle.Model):
+        __model_options__ = {"lazy": True}
+        _secret = middle.field(type=str)
+        size = middle.field(type=int, default="3")
+        double = middle.field(
+            type=int, default=attr.Factory(lambda s: s.size * 2, True)
+        )
+
+    inst = TestModel(secret="foo")
+    assert inst._secret == "foo"
+    assert inst.size == 3
+    assert inst.double == 6
+    inst = object.__new__(TestModel)
+    TestModel.__init__(inst, "foo", 4)
+    assert inst.double == 8
+    assert TestModel.from_many([{"secret": "foo"}])[0].size == 3
+
+    with pytest.raises(TypeError):
+        TestModel(secret="foo", foo="bar")
+    with pytest.raises(TypeError):
+        TestModel(size=1)
+    with pytest.raises(TypeError):
+        TestModel.from_many([{"secret": "foo", "foo": "bar"}])
+
+
+class CountryModel(middle.Model):
+    cities = middle.field(type=t.List[CityModel], lazy=True, min_items=1)
+    codes = middle.field(type=t.List[int], lazy=True, default=None)
+
+
+class CompiledCountryModel(CountryModel):
+    __model_options__ = {"compiled": True}
+
+
+@pytest.mark.parametrize("model", [CountryModel, CompiledCountryModel])
+def test_lazy_list(model):
+    inst = model(cities=[{"name": "Blumenau"}, {"name": "x"}], codes=["1"])
+    assert isinstance(inst.cities, middle.LazyList)
+    assert len(inst.cities) == 2
+    first = inst.cities[0]
+    assert isinstance(first, CityModel)
+    assert inst.cities[0] is first
+    assert inst.codes == [1]
+    with pytest.raises(ValidationError):
+        inst.cities[1]
+    with pytest.raises(ValidationError):
+        list(inst.cities)
+
+    inst.cities[1] = CityModel(name="Manaus")
+    inst.cities.append(CityModel(name="Curitiba"))
+    assert [c.name for c in inst.cities] == ["Blumenau", "Manaus", "Curitiba"]
+    assert [c.name for c in inst.cities[1:]] == ["Manaus", "Curitiba"]
+    assert middle.asdict(inst) == {
+        "cities": [
+            {"name": "Blumenau"},
+            {"name": "Manaus"},
+            {"name": "Curitiba"},
+        ],
+        "codes": [1],
+    }
+    assert middle.asdict(model.loads(middle.dumps(inst))) == middle.asdict(
+        inst
+    )
+    assert middle.asdict(pickle.loads(pickle.dumps(inst))) == middle.asdict(
+        inst
+    )
+
+    with pytest.raises(ValidationError):
+        model(cities=[])
+
+
+def test_lazy_list_invalid():
+    with pytest.raises(middle.exceptions.InvalidType):
+
+        class SetModel(middle.Model):
+            names = middle.field(type=t.Set[str], lazy=True)
+
+    with pytest.raises(TypeError):
+
+        class UniqueModel(middle.Model):
+            names = middle.field(
+                type=t.List[str], lazy=True, unique_items=True
+            )
+
+
+def test_lazy_evolve():
+    inst = GameModel(**DATA)
+    assert inst.name == "Cities: Skylines"
+    evolved = middle.evolve(inst, score=-1.0, players="4")
+    assert "score" not in evolved.__dict__
+    assert evolved.name == "Cities: Skylines"
+    assert evolved.players == 4
+    assert inst.score == 9.0
+    with pytest.raises(ValidationError):
+        evolved.score
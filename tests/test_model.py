@@ -150,3 +150,155 @@ def test_attr_whitelist_kwargs(kwarg, value):
 
     assert TestModel(name="bar").name == "bar"
     assert TestModel().name == "foo"
+
+
+def test_from_many():
+    class TestObj:
+        def __init__(self):
+            self.name = "foo"
+            self.age = 42
+
+    class TestModel(middle.Model):
+        name = {"type": str}
+        age = {"type": int, "minimum": 0}
+
+    records = [
+        {"name": "bar", "age": "21"},
+        TestObj(),
+        {"name": "baz", "age": 1},
+    ]
+    instances = TestModel.from_many(records)
+
+    assert isinstance(instances, list)
+    assert [(i.name, i.age) for i in instances] == [
+        ("bar", 21),
+        ("foo", 42),
+        ("baz", 1),
+    ]
+
+    generator = TestModel.from_many(iter(records), generator=True)
+    assert not isinstance(generator, list)
+    assert next(generator).name == "bar"
+
+    assert middle.asdict_many(instances) == [
+        {"name": "bar", "age": 21},
+        {"name": "foo", "age": 42},
+        {"name": "baz", "age": 1},
+    ]
+    assert list(middle.asdict_many(instances, generator=True)) == [
+        middle.asdict(i) for i in instances
+    ]
+
+    with pytest.raises(middle.exceptions.ValidationError):
+        TestModel.from_many([{"name": "bar", "age": -1}])
+
+    with pytest.raises(TypeError):
+        TestModel.from_many([{"name": "bar"}])
+
+    with pytest.raises(TypeError):
+        TestModel.from_many(["bar"])
+
+
+def test_partial():
+    class CityModel(middle.Model):
+        name = middle.field(type=str, min_length=3)
+
+    class GameModel(middle.Model):
+        name = middle.field(type=str)
+        score = middle.field(type=float, minimum=0)
+        city = middle.field(type=CityModel)
+        tags = middle.field(type=t.Set[str], default=attr.Factory(set))
+
+        def __attrs_post_init__(self):
+            raise AssertionError("should not be called")
+
+    record = {"name": "foo", "score": "9", "city": {"name": "x"}}
+    inst = GameModel.partial(record, fields={"name", "score", "tags"})
+    assert isinstance(inst, GameModel)
+    assert inst.name == "foo"
+    assert inst.score == 9.0
+    assert inst.tags == set()
+    assert repr(inst) == "GameModel(name='foo', score=9.0, tags=set())"
+    assert not hasattr(inst, "city")
+    with pytest.raises(middle.exceptions.FieldNotLoaded) as exc:
+        inst.city
+    assert "'city' was not loaded" in str(exc.value)
+    with pytest.raises(middle.exceptions.FieldNotLoaded):
+        middle.asdict(inst)
+
+    inst.score = 1.0
+    assert inst.score == 1.0
+
+    with pytest.raises(middle.exceptions.ValidationError):
+        GameModel.partial({"score": -1.0}, fields=["score"])
+    with pytest.raises(middle.exceptions.ValidationError):
+        GameModel.partial(record, fields=["city"])
+    with pytest.raises(TypeError):
+        GameModel.partial({}, fields=["name"])
+    with pytest.raises(TypeError):
+        GameModel.partial(record, fields=["foo"])
+    with pytest.raises(TypeError):
+        GameModel.partial(["foo"], fields=["name"])
+
+
+@pytest.mark.parametrize("options", [{}, {"frozen": True, "slots": True}])
+def test_construct(options):
+    class CityModel(middle.Model):
+        name = middle.field(type=str, min_length=3)
+
+    class GameModel(middle.Model):
+        __model_options__ = options
+        name = middle.field(type=str)
+        score = middle.field(type=float, minimum=0)
+        city = middle.field(type=CityModel)
+        tags = middle.field(type=t.Set[str], default=attr.Factory(set))
+        _secret = middle.field(type=str, default=None)
+
+    city = CityModel(name="Blumenau")
+    inst = GameModel.construct(name="foo", score=-1, city=city, secret="x")
+    assert isinstance(inst, GameModel)
+    assert inst.score == -1  # not converted, nor validated
+    assert type(inst.score) is int
+    assert inst.city is city
+    assert inst.tags == set()
+    assert inst._secret == "x"
+
+    data = {"name": "foo", "score": 1.0, "city": city, "tags": {"a"}}
+    assert middle.asdict(GameModel.construct(**data)) == middle.asdict(
+        GameModel(**data)
+    )
+
+    with pytest.raises(TypeError):
+        GameModel.construct(name="foo")
+    with pytest.raises(TypeError):
+        GameModel.construct(name="foo", score=1.0, city=city, foo="bar")
+
+
+@pytest.mark.parametrize(
+    "options", [{}, {"compiled": True}, {"frozen": True, "slots": True}]
+)
+def test_evolve(options):
+    class CityModel(middle.Model):
+        name = middle.field(type=str, min_length=3)
+
+    class GameModel(middle.Model):
+        __model_options__ = options
+        name = middle.field(type=str)
+        score = middle.field(type=float, minimum=0)
+        cities = middle.field(type=t.List[CityModel])
+        _secret = middle.field(type=str, default=None)
+
+    inst = GameModel(name="foo", score=1.0, cities=[{"name": "Blumenau"}])
+    evolved = middle.evolve(inst, score="2", secret=42)
+    assert isinstance(evolved, GameModel)
+    assert evolved is not inst
+    assert evolved.score == 2.0
+    assert evolved._secret == "42"
+    assert evolved.cities is inst.cities
+    assert inst.score == 1.0
+    assert inst._secret is None
+
+    with pytest.raises(middle.exceptions.ValidationError):
+        middle.evolve(inst, score=-1.0)
+    with pytest.raises(TypeError):
+        middle.evolve(inst, foo="bar")
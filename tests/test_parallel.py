@@ -0,0 +1,53 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import middle
+
+from middle.exceptions import ValidationError
+
+
+class CityModel(middle.Model):
+    name = middle.field(type=str, min_length=3)
+    population = middle.field(type=int, minimum=0)
+
+
+RECORDS = [
+    {"name": "city{}".format(i), "population": str(i)} for i in range(250)
+]
+
+
+def test_map_models_serial():
+    cities = middle.parallel.map_models(CityModel, iter(RECORDS), workers=4)
+    assert [c.population for c in cities] == list(range(250))
+
+
+def test_map_models_processes():
+    cities = middle.parallel.map_models(
+        CityModel, RECORDS, workers=2, chunksize=30, serial_threshold=100
+    )
+    assert all(isinstance(c, CityModel) for c in cities)
+    assert [c.name for c in cities] == [r["name"] for r in RECORDS]
+    assert cities[42].population == 42
+
+
+def test_map_models_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        cities = middle.parallel.map_models(
+            CityModel,
+            (r for r in RECORDS),
+            chunksize=7,
+            serial_threshold=10,
+            executor=executor,
+        )
+    assert [c.population for c in cities] == list(range(250))
+
+
+def test_map_models_errors():
+    records = RECORDS + [{"name": "x", "population": 1}]
+    with pytest.raises(ValidationError):
+        middle.parallel.map_models(
+            CityModel, records, workers=2, serial_threshold=100
+        )
+    with pytest.raises(ValidationError):
+        middle.parallel.map_models(CityModel, records, workers=2)
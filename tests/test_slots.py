@@ -0,0 +1,83 @@
+import pickle
+import typing as t
+
+import pytest
+
+import middle
+
+from middle.exceptions import ValidationError
+
+
+class CityModel(middle.Model):
+    __model_options__ = {"slots": True}
+    name = middle.field(type=str, min_length=3)
+    tags = middle.field(type=t.List[str], default=None)
+
+    def shout(self):
+        return self.name.upper()
+
+    @property
+    def initial(self):
+        return self.name[0]
+
+
+class CapitalModel(CityModel):
+    country = middle.field(type=str, default="BR")
+
+    def __attrs_post_init__(self):
+        self.name = self.name.title()
+
+
+class CompiledCapitalModel(CapitalModel):
+    __model_options__ = {"compiled": True}
+
+
+@pytest.mark.parametrize(
+    "model", [CityModel, CapitalModel, CompiledCapitalModel]
+)
+def test_slots(model):
+    assert model.__model_options__["slots"] is True
+    inst = model({"name": "blumenau", "tags": ("a",)})
+    assert not hasattr(inst, "__dict__")
+    assert inst.tags == ["a"]
+    assert inst.shout() == "BLUMENAU"
+    assert inst.initial in ("b", "B")
+    with pytest.raises(AttributeError):
+        inst.foo = "bar"
+    with pytest.raises(ValidationError):
+        model(name="x")
+
+    data = middle.asdict(inst)
+    assert middle.asdict(model(data)) == data
+    assert middle.asdict(model.loads(middle.dumps(inst))) == data
+    assert middle.asdict(pickle.loads(pickle.dumps(inst))) == data
+    assert [i.name for i in model.from_many([data, data])] == [
+        inst.name,
+        inst.name,
+    ]
+    partial = model.partial(data, fields=["name"])
+    assert not hasattr(partial, "__dict__")
+    assert partial.name == inst.name
+
+
+def test_slots_inheritance():
+    assert CapitalModel(name="Brasília").name == "Brasília"
+    assert CapitalModel(name="brasília").country == "BR"
+
+    class NoSlotsModel(CityModel):
+        __model_options__ = {"slots": False}
+
+    assert hasattr(NoSlotsModel(name="foo"), "__dict__")
+
+    class PlainModel(middle.Model):
+        name = middle.field(type=str)
+
+    assert PlainModel.__model_options__["slots"] is False
+    assert hasattr(PlainModel(name="foo"), "__dict__")
+
+
+def test_slots_lazy():
+    with pytest.raises(TypeError):
+
+        class LazyModel(CityModel):
+            __model_options__ = {"lazy": True}
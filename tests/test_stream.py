@@ -0,0 +1,156 @@
+import gzip
+import io
+import json
+import typing as t
+
+import pytest
+
+import middle
+
+from middle.exceptions import ValidationError
+
+
+class CityModel(middle.Model):
+    name = middle.field(type=str, min_length=3)
+    population = middle.field(type=int, minimum=0, default=None)
+
+
+NDJSON = (
+    b'{"name": "Blumenau", "population": 352460}\n'
+    b"\n"
+    b'{"name": "Manaus"}\n'
+    b'{"name": "x"}\n'
+    b"{not json\n"
+    b"[1, 2]\n"
+    b'{"name": "Tokyo", "population": "13515271"}'
+)
+
+
+class _ReadOnly:
+    # a file like object with nothing but ``read``
+    def __init__(self, data):
+        self._data = io.BytesIO(data)
+
+    def read(self, size=-1):
+        return self._data.read(size)
+
+
+@pytest.mark.parametrize(
+    "fileobj",
+    [
+        pytest.param(lambda: io.BytesIO(NDJSON), id="bytes"),
+        pytest.param(lambda: io.StringIO(NDJSON.decode()), id="text"),
+        pytest.param(
+            lambda: io.BufferedReader(io.BytesIO(gzip.compress(NDJSON))),
+            id="gzip",
+        ),
+        pytest.param(lambda: _ReadOnly(gzip.compress(NDJSON)), id="read"),
+        pytest.param(lambda: _ReadOnly(NDJSON), id="read_plain"),
+    ],
+)
+def test_read_ndjson(fileobj):
+    items = list(
+        middle.stream.read_ndjson(CityModel, fileobj(), yield_errors=True)
+    )
+    assert [i.name for i in items if isinstance(i, CityModel)] == [
+        "Blumenau",
+        "Manaus",
+        "Tokyo",
+    ]
+    assert items[-1].population == 13515271
+    errors = [i for i in items if not isinstance(i, CityModel)]
+    assert [line_no for line_no, _ in errors] == [4, 5, 6]
+    assert isinstance(errors[0][1], ValidationError)
+    assert isinstance(errors[1][1], ValueError)
+    assert isinstance(errors[2][1], TypeError)
+
+
+class ScoresModel(middle.Model):
+    scores = middle.field(type=t.Dict[str, int])
+
+
+def test_read_ndjson_wrongly_shaped_containers():
+    lines = io.StringIO('{"scores": [1]}\n{"scores": {"a": "1"}}\n')
+    items = list(
+        middle.stream.read_ndjson(ScoresModel, lines, yield_errors=True)
+    )
+    assert items[0][0] == 1
+    assert isinstance(items[0][1], Exception)
+    assert items[1].scores == {"a": 1}
+
+
+def test_read_ndjson_raises():
+    items = middle.stream.read_ndjson(CityModel, io.BytesIO(NDJSON))
+    assert next(items).name == "Blumenau"
+    assert next(items).name == "Manaus"
+    with pytest.raises(ValidationError):
+        next(items)
+
+
+class _CountingLines(io.StringIO):
+    served = 0
+
+    def __next__(self):
+        self.served += 1
+        return super().__next__()
+
+
+def test_read_ndjson_is_lazy():
+    fileobj = _CountingLines('{"name": "Blumenau"}\n' * 10)
+    items = middle.stream.read_ndjson(CityModel, fileobj)
+    assert next(items).name == "Blumenau"
+    assert fileobj.served == 1
+    assert len(list(items)) == 9
+
+
+class TagsModel(middle.Model):
+    name = middle.field(type=str)
+    tags = middle.field(type=t.Set[str])
+
+
+class _Writer:
+    # a socket like writer, recording each chunk written
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data):
+        self.chunks.append(data)
+
+
+def test_write_ndjson():
+    cities = [CityModel(name="Blumenau"), CityModel(name="Manaus")]
+    fileobj = io.StringIO()
+    middle.stream.write_ndjson(fileobj, cities)
+    assert fileobj.getvalue() == (
+        '{"name":"Blumenau","population":null}\n'
+        '{"name":"Manaus","population":null}\n'
+    )
+    fileobj.seek(0)
+    assert [c.name for c in middle.stream.read_ndjson(CityModel, fileobj)] == [
+        "Blumenau",
+        "Manaus",
+    ]
+
+
+def test_write_ndjson_chunks():
+    writer = _Writer()
+    cities = (CityModel(name="city{}".format(i)) for i in range(5))
+    middle.stream.write_ndjson(writer, cities, chunksize=2)
+    assert len(writer.chunks) == 3
+    assert all(isinstance(c, bytes) for c in writer.chunks)
+    assert b"".join(writer.chunks).count(b"\n") == 5
+
+
+def test_write_json_array():
+    fileobj = io.BytesIO()
+    middle.stream.write_json_array(
+        fileobj, [TagsModel(name="a", tags=["x"]), CityModel(name="Tokyo")]
+    )
+    assert json.loads(fileobj.getvalue()) == [
+        {"name": "a", "tags": ["x"]},
+        {"name": "Tokyo", "population": None},
+    ]
+
+    fileobj = io.StringIO()
+    middle.stream.write_json_array(fileobj, [])
+    assert json.loads(fileobj.getvalue()) == []
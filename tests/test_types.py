@@ -1,3 +1,4 @@
+import sys
 import typing as t
 
 from datetime import date, datetime, timezone
@@ -12,6 +13,13 @@ import middle
 from middle.exceptions import InvalidType, ValidationError
 
 
+pep585 = pytest.mark.skipif(
+    sys.version_info < (3, 9), reason="list[int] requires python 3.9+"
+)
+pep604 = pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="int | None requires python 3.10+"
+)
+
 # #############################################################################
 # str
 
@@ -566,7 +574,13 @@ class SomeJunk:
         return "hello"
 
 
-@pytest.mark.parametrize("list_type", [pytest.param(t.List, id="List")])
+@pytest.mark.parametrize(
+    "list_type",
+    [
+        pytest.param(t.List, id="List"),
+        pytest.param(list, id="list", marks=pep585),
+    ],
+)
 def test_list_working(list_type):
     class TestModel(middle.Model):
         names = middle.field(type=list_type[str])
@@ -582,7 +596,13 @@ def test_list_working(list_type):
     assert data.get("names", None) == ["foo", "bar"]
 
 
-@pytest.mark.parametrize("list_type", [pytest.param(t.List, id="List")])
+@pytest.mark.parametrize(
+    "list_type",
+    [
+        pytest.param(t.List, id="List"),
+        pytest.param(list, id="list", marks=pep585),
+    ],
+)
 def test_list_converter(list_type):
     class TestModel(middle.Model):
         names = middle.field(type=list_type[str])
@@ -630,7 +650,13 @@ def test_list_default(list_type):
 # Set
 
 
-@pytest.mark.parametrize("set_type", [pytest.param(t.Set, id="Set")])
+@pytest.mark.parametrize(
+    "set_type",
+    [
+        pytest.param(t.Set, id="Set"),
+        pytest.param(set, id="set", marks=pep585),
+    ],
+)
 def test_set_working(set_type):
     class TestModel(middle.Model):
         names = middle.field(type=set_type[str])
@@ -646,7 +672,13 @@ def test_set_working(set_type):
     assert data.get("names", None) == {"bar", "foo"}
 
 
-@pytest.mark.parametrize("set_type", [pytest.param(t.Set, id="Set")])
+@pytest.mark.parametrize(
+    "set_type",
+    [
+        pytest.param(t.Set, id="Set"),
+        pytest.param(set, id="set", marks=pep585),
+    ],
+)
 def test_set_converter(set_type):
     class TestModel(middle.Model):
         names = middle.field(type=set_type[str])
@@ -688,7 +720,13 @@ def test_set_default(set_type):
 # Dict
 
 
-@pytest.mark.parametrize("dict_type", [pytest.param(t.Dict, id="Dict")])
+@pytest.mark.parametrize(
+    "dict_type",
+    [
+        pytest.param(t.Dict, id="Dict"),
+        pytest.param(dict, id="dict", marks=pep585),
+    ],
+)
 def test_dict_working(dict_type):
     class TestModel(middle.Model):
         ratings = middle.field(type=dict_type[str, float])
@@ -719,7 +757,13 @@ def test_dict_working(dict_type):
     }
 
 
-@pytest.mark.parametrize("dict_type", [pytest.param(t.Dict, id="Dict")])
+@pytest.mark.parametrize(
+    "dict_type",
+    [
+        pytest.param(t.Dict, id="Dict"),
+        pytest.param(dict, id="dict", marks=pep585),
+    ],
+)
 def test_dict_converter(dict_type):
     class TestModel(middle.Model):
         ratings = middle.field(type=dict_type[str, float])
@@ -798,6 +842,42 @@ def test_optional_default(value, expected):
     assert TestModel().name == expected
 
 
+def test_optional_container():
+    class TestModel(middle.Model):
+        ratings = middle.field(type=t.Optional[t.Dict[str, float]])
+
+    assert TestModel(ratings=None).ratings is None
+    assert TestModel(ratings={"foo": 4.2}).ratings == {"foo": 4.2}
+
+
+def test_optional_enum():
+    @unique
+    class SizeEnum(IntEnum):
+        SMALL = 1
+        BIG = 2
+
+    class TestModel(middle.Model):
+        size = middle.field(type=t.Optional[SizeEnum])
+
+    assert TestModel(size=None).size is None
+    assert TestModel(size=2).size is SizeEnum.BIG
+    assert TestModel(size=SizeEnum.SMALL).size is SizeEnum.SMALL
+    with pytest.raises(ValueError):
+        TestModel(size=3)
+
+
+@pep604
+def test_optional_pep604():
+    class TestModel(middle.Model):
+        name = middle.field(type=str | None, default=None)
+        tags = middle.field(type=list[str] | None, default=None)
+
+    assert TestModel().name is None
+    assert TestModel(name=1).name == "1"
+    assert TestModel(tags=["foo"]).tags == ["foo"]
+    assert middle.asdict(TestModel(name="foo")) == {"name": "foo", "tags": None}
+
+
 # #############################################################################
 # Union
 
@@ -886,6 +966,16 @@ def test_union_default(val, expected, type_):
     assert TestModel().value == expected
 
 
+@pep604
+def test_union_pep604():
+    class TestModel(middle.Model):
+        value = middle.field(type=str | int | float)
+
+    assert TestModel(value=3.14).value == 3.14
+    assert TestModel(value=-1).value == -1
+    assert middle.asdict(TestModel(value="foo")) == {"value": "foo"}
+
+
 # #############################################################################
 # Tuple
 
@@ -1127,6 +1217,128 @@ def test_unregister_unknown_type():
     assert middle.validate(Bar, {}) == middle.validate(object, {})
 
 
+# #############################################################################
+# Subclasses of supported types
+
+
+class NameStr(str):
+    pass
+
+
+class AgeInt(int):
+    pass
+
+
+class PriceDecimal(Decimal):
+    pass
+
+
+class WhenDatetime(datetime):
+    pass
+
+
+class BirthdayDate(date):
+    pass
+
+
+@pytest.mark.parametrize("compiled", [False, True])
+def test_subclasses_of_supported_types(compiled):
+    class TestModel(middle.Model):
+        __model_options__ = {"compiled": compiled}
+        name = middle.field(type=NameStr, min_length=2)
+        age = middle.field(type=AgeInt, minimum=0)
+        price = middle.field(type=PriceDecimal)
+        when = middle.field(type=WhenDatetime)
+        birthday = middle.field(type=BirthdayDate)
+
+    inst = TestModel(
+        name=b"Joe",
+        age="42",
+        price="1.5",
+        when="2018-10-28T10:30:00+00:00",
+        birthday="1976-03-21",
+    )
+    assert type(inst.name) is NameStr
+    assert type(inst.age) is AgeInt
+    assert type(inst.price) is PriceDecimal
+    assert type(inst.when) is WhenDatetime
+    assert type(inst.birthday) is BirthdayDate
+    assert inst.when == datetime(2018, 10, 28, 10, 30, tzinfo=timezone.utc)
+    assert inst.birthday == date(1976, 3, 21)
+    assert middle.asdict(inst) == {
+        "name": "Joe",
+        "age": 42,
+        "price": 1.5,
+        "when": "2018-10-28T10:30:00+00:00",
+        "birthday": "1976-03-21",
+    }
+
+    with pytest.raises(ValidationError):
+        TestModel(
+            name="J",
+            age=42,
+            price="1.5",
+            when=inst.when,
+            birthday=inst.birthday,
+        )
+    with pytest.raises(ValidationError):
+        TestModel(
+            name="Joe",
+            age=-1,
+            price="1.5",
+            when=inst.when,
+            birthday=inst.birthday,
+        )
+
+
+def test_dispatch_cache():
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    @middle.type_dispatch()
+    def describe(type_):
+        return "unknown"
+
+    assert describe(Child) == "unknown"
+    assert describe(Child) == "unknown"
+    info = describe.dispatch_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+    describe.register(Base, lambda type_: "base")
+    assert describe.dispatch_info() == (0, 0, 0, None, 0)
+    assert describe(Child) == "base"
+    assert describe(Base) == "base"
+
+    describe.register(Child, lambda type_: "child")
+    assert describe(Child) == "child"
+
+    describe.unregister(Base)
+    assert describe(Base) == "unknown"
+    assert describe(Child) == "child"
+    assert describe.dispatch_info().currsize == 2
+
+
+def test_dispatch_cache_lru():
+    class Other:
+        pass
+
+    with pytest.raises(InvalidType):
+        middle.converter(Other)
+
+    middle.converter.register(Other, lambda type_: str)
+    try:
+        assert middle.converter(Other) is str
+    finally:
+        middle.converter.unregister(Other)
+
+    with pytest.raises(InvalidType):
+        middle.converter(Other)
+    assert middle.converter.dispatch_info().misses > 0
+
+
 # #############################################################################
 # None
 
@@ -11,6 +11,10 @@ import middle
 
 from middle.exceptions import ValidationError
 from middle.validators import BaseValidator
+from middle.validators.dicts import DictValidator
+from middle.validators.lists import ListValidator
+from middle.validators.numbers import NumberValidator
+from middle.validators.strings import StringValidator
 
 
 # #############################################################################
@@ -976,3 +980,165 @@ def test_dict_with_default():
 
     with pytest.raises(ValidationError):
         TestNoneModel(value={"bar": 2, "baz": 3, "foo": 4})
+
+
+# #############################################################################
+# specialized validators
+
+
+@pytest.mark.parametrize(
+    "validator,valid_values,invalid_values",
+    [
+        pytest.param(NumberValidator(minimum=3), [3, 4], [2], id="minimum"),
+        pytest.param(
+            NumberValidator(maximum=3, exclusive_maximum=True),
+            [2],
+            [3, 4],
+            id="exclusive_maximum",
+        ),
+        pytest.param(
+            NumberValidator(multiple_of=0.5), [1.5, 2.0], [1.2], id="float"
+        ),
+        pytest.param(NumberValidator(multiple_of=3), [6, 9], [7], id="int"),
+        pytest.param(
+            StringValidator(min_length=2, pattern="^[a-z]+$"),
+            ["ab", "abc"],
+            ["a", "a1"],
+            id="str",
+        ),
+        pytest.param(
+            ListValidator(max_items=2, unique_items=True),
+            [[1], [1, 2]],
+            [[1, 2, 3], [1, 1]],
+            id="list",
+        ),
+        pytest.param(
+            DictValidator(min_properties=1), [{"a": 1}], [{}], id="dict"
+        ),
+    ],
+)
+def test_specialized_validator(validator, valid_values, invalid_values):
+    field = attr.fields(
+        attr.make_class("TestModel", {"value": attr.ib(default=None)})
+    ).value
+    fn = validator.specialize(nullable=True)
+
+    assert fn.__wrapped__ is validator
+    assert fn is not validator
+
+    fn(None, field, None)
+    for value in valid_values:
+        fn(None, field, value)
+    for value in invalid_values:
+        with pytest.raises(ValidationError) as exc:
+            fn(None, field, value)
+        with pytest.raises(ValidationError) as original_exc:
+            validator(None, field, value)
+        assert str(exc.value) == str(original_exc.value)
+
+
+def test_specialized_validator_without_constraints():
+    field = attr.fields(attr.make_class("TestModel", ["value"])).value
+    fn = NumberValidator(exclusive_minimum=True).specialize()
+    fn(None, field, 42)
+    assert fn.__wrapped__ == NumberValidator(exclusive_minimum=True)
+
+
+def test_specialized_validator_in_model():
+    class TestModel(middle.Model):
+        value = middle.field(type=int, minimum=3)
+
+    validator = attr.fields(TestModel).value.validator
+    assert validator._validators[0] == NumberValidator(minimum=3)
+    assert validator._fns[0].__wrapped__ is validator._validators[0]
+    assert validator._fns[1] is validator._validators[1]
+    TestModel(value=3)
+    with pytest.raises(ValidationError):
+        TestModel(value=2)
+
+
+def test_validate_columns():
+    numpy = pytest.importorskip("numpy")
+
+    class TestModel(middle.Model):
+        name = middle.field(type=str, min_length=2, max_length=4)
+        code = middle.field(type=str, pattern=r"^\d+$", default=None)
+        value = middle.field(type=int, minimum=0, multiple_of=2)
+        score = middle.field(
+            type=float, maximum=10, exclusive_maximum=True, multiple_of=0.01
+        )
+        tags = middle.field(type=t.List[str], min_items=1)
+
+    columns = {
+        "name": ["ab", "a", "abcd", "abcde", "abc", "abc", "abc", "abc"],
+        "code": ["1", None, "12", "1", "x", "1", "1", "1"],
+        "value": numpy.array([0, 2, 4, 6, 8, -2, 3, 10]),
+        "score": numpy.array([0.3, 9.99, 1.0, 2.5, 1.0, 1.0, 10.25, 10.0]),
+        "tags": [["a"], ["a"], ["a"], ["a"], ["a"], ["a"], ["a"], []],
+    }
+    errors = middle.validate_columns(TestModel, columns)
+    assert errors.dtype == numpy.bool_
+    assert errors.tolist() == [
+        False,
+        True,
+        False,
+        True,
+        True,
+        True,
+        True,
+        True,
+    ]
+    for row, error in enumerate(errors):
+        record = {k: v[row] for k, v in columns.items()}
+        record["value"] = int(record["value"])
+        record["score"] = float(record["score"])
+        if error:
+            with pytest.raises(ValidationError):
+                TestModel(**record)
+        else:
+            TestModel(**record)
+
+    assert middle.validate_columns(
+        TestModel, {"score": [0.001, 1.5]}
+    ).tolist() == [True, False]
+    assert middle.validate_columns(
+        TestModel, {"name": numpy.array(["abc", None], dtype=object)}
+    ).tolist() == [False, True]
+
+    with pytest.raises(TypeError):
+        middle.validate_columns(TestModel, {"foo": [1]})
+    with pytest.raises(ValueError):
+        middle.validate_columns(TestModel, {"name": ["ab"], "value": []})
+
+
+def test_validate_columns_none():
+    pytest.importorskip("numpy")
+
+    class TestModel(middle.Model):
+        value = middle.field(type=t.Optional[int])
+        count = middle.field(type=int, minimum=0, default=None)
+        total = middle.field(type=int, minimum=0)
+
+    errors = middle.validate_columns(
+        TestModel, {"value": [1, None, -1], "count": [1, None, -1]}
+    )
+    assert errors.tolist() == [False, False, True]
+    assert middle.validate_columns(
+        TestModel, {"total": [1, None, 2]}
+    ).tolist() == [False, True, False]
+    TestModel(value=None, count=None, total=0)
+
+
+def test_validate_model_array_columns():
+    pytest.importorskip("numpy")
+
+    class TestModel(middle.Model):
+        value = middle.field(type=int, minimum=0)
+
+    array = middle.ModelArray(TestModel, [{"value": 1}, {"value": 2}])
+    columns = array.to_columns()
+    columns["value"] -= 2
+    assert middle.validate_columns(TestModel, columns).tolist() == [
+        True,
+        False,
+    ]
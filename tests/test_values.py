@@ -0,0 +1,173 @@
+import typing as t
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from enum import Enum, unique
+
+import middle
+
+from middle.values import (
+    _asdict_fn,
+    _raw_dict,
+    _raw_list,
+    _raw_set,
+    _raw_tuple,
+)
+
+
+@unique
+class RegionEnum(str, Enum):
+    TROPICAL = "TROPICAL"
+    TEMPERATE = "TEMPERATE"
+
+
+class CityModel(middle.Model):
+    name = middle.field(type=str)
+    region = middle.field(type=RegionEnum)
+
+
+class CapitalModel(CityModel):
+    country = middle.field(type=str)
+
+
+class TripModel(middle.Model):
+    city = middle.field(type=CityModel)
+    budget = middle.field(type=Decimal)
+    departure = middle.field(type=date)
+    arrival = middle.field(type=datetime)
+    tags = middle.field(type=t.List[str])
+    returning = middle.field(type=date, default=None)
+    region = middle.field(type=RegionEnum, default=None)
+
+
+def test_asdict():
+    inst = TripModel(
+        city={"name": "Blumenau", "region": "TEMPERATE"},
+        budget="1200.50",
+        departure="2018-07-18",
+        arrival=datetime(2018, 7, 19, 12, tzinfo=timezone.utc),
+        tags=["beer", "oktoberfest"],
+    )
+    assert middle.asdict(inst) == {
+        "city": {"name": "Blumenau", "region": "TEMPERATE"},
+        "budget": 1200.5,
+        "departure": "2018-07-18",
+        "arrival": "2018-07-19T12:00:00+00:00",
+        "tags": ["beer", "oktoberfest"],
+        "returning": None,
+        "region": None,
+    }
+
+
+def test_asdict_subclass_instance():
+    capital = CapitalModel(name="London", region="TEMPERATE", country="UK")
+    inst = TripModel(
+        city=capital,
+        budget=Decimal("1"),
+        departure=date(2018, 7, 18),
+        arrival=datetime(2018, 7, 19, 12, tzinfo=timezone.utc),
+        tags=[],
+    )
+    assert inst.city is capital
+    assert middle.asdict(inst)["city"] == {
+        "name": "London",
+        "region": "TEMPERATE",
+        "country": "UK",
+    }
+
+
+def test_asdict_is_compiled_once_per_class():
+    city = CityModel(name="Blumenau", region="TEMPERATE")
+    capital = CapitalModel(name="London", region="TEMPERATE", country="UK")
+    assert middle.asdict(city) == {"name": "Blumenau", "region": "TEMPERATE"}
+    assert _asdict_fn(CityModel) is _asdict_fn(CityModel)
+    assert _asdict_fn(CityModel) is not _asdict_fn(CapitalModel)
+    assert middle.asdict(capital) == {
+        "name": "London",
+        "region": "TEMPERATE",
+        "country": "UK",
+    }
+
+
+class BagModel(middle.Model):
+    tags = middle.field(type=t.List[str])
+    prices = middle.field(type=t.List[Decimal])
+    regions = middle.field(type=t.Set[RegionEnum])
+    dates = middle.field(type=t.Dict[str, date])
+    pair = middle.field(type=t.Tuple[int, Decimal])
+    matrix = middle.field(type=t.List[t.List[Decimal]])
+    cities = middle.field(type=t.List[CityModel])
+
+
+def test_asdict_containers():
+    inst = BagModel(
+        tags=["a", "b"],
+        prices=["1.5", "2"],
+        regions=["TROPICAL"],
+        dates={"start": "2018-07-18"},
+        pair=(1, "1.5"),
+        matrix=[["1.5"], ["2.5", "3"]],
+        cities=[{"name": "Blumenau", "region": "TEMPERATE"}],
+    )
+    data = middle.asdict(inst)
+    assert data == {
+        "tags": ["a", "b"],
+        "prices": [1.5, 2.0],
+        "regions": {"TROPICAL"},
+        "dates": {"start": "2018-07-18"},
+        "pair": (1, 1.5),
+        "matrix": [[1.5], [2.5, 3.0]],
+        "cities": [{"name": "Blumenau", "region": "TEMPERATE"}],
+    }
+    assert data["tags"] is not inst.tags
+    assert isinstance(data["prices"][0], float)
+
+
+def test_value_of_containers():
+    assert middle.value_of(t.List[str])(["a"]) == ["a"]
+    assert middle.value_of(t.List[str])(None) is None
+    assert middle.value_of(t.Dict[str, int])({"a": 1}) == {"a": 1}
+    assert middle.value_of(t.Tuple[str, ...])(("a", "b")) == ("a", "b")
+    assert middle.value_of(t.Tuple[date, ...])((date(2018, 7, 18),)) == (
+        "2018-07-18",
+    )
+    assert middle.value_of(t.Dict[RegionEnum, Decimal])(
+        {RegionEnum.TROPICAL: Decimal("1.5")}
+    ) == {"TROPICAL": 1.5}
+
+
+def test_value_of_untyped_containers():
+    values = [Decimal("1.5"), date(2018, 7, 18), RegionEnum.TROPICAL, "a"]
+    expected = [1.5, "2018-07-18", "TROPICAL", "a"]
+    assert _raw_list(values) == expected
+    assert _raw_tuple(values) == tuple(expected)
+    assert _raw_set(values) == set(expected)
+    assert _raw_dict(dict(zip(values, values))) == dict(
+        zip(expected, expected)
+    )
+
+
+class UnionBagModel(middle.Model):
+    moments = middle.field(type=t.List[t.Union[int, datetime]])
+    places = middle.field(type=t.Dict[str, t.Union[int, CityModel]])
+    dates = middle.field(type=t.List[t.Optional[date]])
+
+
+def test_asdict_containers_of_unions():
+    moment = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    inst = UnionBagModel(
+        moments=[moment, 3],
+        places={
+            "a": CityModel(name="Blumenau", region="TEMPERATE"),
+            "b": 1,
+        },
+        dates=["2018-07-18"],
+    )
+    assert middle.asdict(inst) == {
+        "moments": ["2020-01-01T00:00:00+00:00", 3],
+        "places": {"a": {"name": "Blumenau", "region": "TEMPERATE"}, "b": 1},
+        "dates": ["2018-07-18"],
+    }
+    assert middle.value_of(t.List[t.Union[int, datetime]])([moment]) == [
+        "2020-01-01T00:00:00+00:00"
+    ]